@@ -1,77 +1,84 @@
-from .bridge import BoundLoggerBase
-from .exceptions import (
-    AlConfigurationError,
-    AlHandlerError,
-    AlLoggerCreationError,
-    AlProcessorError,
-    AlQueueManagerError,
-)
-from .factory import LoggerFactory
-from .handlers import (
-    AsyncFileHandler,
-    AsyncNullHandler,
-    AsyncRotatingFileHandler,
-    AsyncStreamHandler,
-    Handler,
-    Sink,
-    file_handler,
-    null_handler,
-    rotating_file_handler,
-    stream_handler,
-)
-from .levels import LogLevel, LogLevels
-from .manager import QueueManager
-from .models import (
-    AddCallsiteParamsConfig,
-    AddContextDefaultConfig,
-    AsyncFileHandlerConfig,
-    AsyncStreamHandlerConfig,
-    CallsiteParameter,
-    ColoredStreamRendererConfig,
-    DictTracebacksConfig,
-    FilterByLevelConfig,
-    FilterKeysConfig,
-    FilterMarkupConfig,
-    HandlerConfig,
-    HandlerType,
-    JSONFileRendererConfig,
-    JSONStreamRendererConfig,
-    LoggerConfig,
-    LoggingSystemConfig,
-    NullHandlerConfig,
-    PlainFileRendererConfig,
-    PlainStreamRendererConfig,
-    ProcessorConfig,
-    ProcessorType,
-    QueueConfig,
-    RendererConfig,
-    RendererType,
-)
-from .processors import (
-    ColoredRenderer,
-    DropLog,
-    JSONRenderer,
-    PlainRenderer,
-    add_callsite_params,
-    add_context_defaults,
-    colored_renderer,
-    dict_tracebacks,
-    filter_by_level,
-    filter_keys,
-    filter_markup,
-    json_renderer,
-    plain_renderer,
-)
-from .record import LogRecord
-from .types import (
-    Context,
-    EventDict,
-    FuncProcessor,
-    FuncRenderer,
-    Processor,
-    Renderer,
-    WrappedLogger,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bridge import BoundLoggerBase
+    from .exceptions import (
+        AlConfigurationError,
+        AlHandlerError,
+        AlLoggerCreationError,
+        AlProcessorError,
+        AlQueueManagerError,
+    )
+    from .factory import LoggerFactory
+    from .handlers import (
+        AsyncFileHandler,
+        AsyncNullHandler,
+        AsyncRotatingFileHandler,
+        AsyncStreamHandler,
+        Handler,
+        Sink,
+        file_handler,
+        null_handler,
+        rotating_file_handler,
+        stream_handler,
+    )
+    from .levels import LogLevel, LogLevels
+    from .manager import QueueManager
+    from .models import (
+        AddCallsiteParamsConfig,
+        AddContextDefaultConfig,
+        AsyncFileHandlerConfig,
+        AsyncStreamHandlerConfig,
+        CallsiteParameter,
+        ColoredStreamRendererConfig,
+        DictTracebacksConfig,
+        FilterByLevelConfig,
+        FilterKeysConfig,
+        FilterMarkupConfig,
+        HandlerConfig,
+        HandlerType,
+        JSONFileRendererConfig,
+        JSONStreamRendererConfig,
+        LoggerConfig,
+        LoggingSystemConfig,
+        NullHandlerConfig,
+        PlainFileRendererConfig,
+        PlainStreamRendererConfig,
+        ProcessorConfig,
+        ProcessorType,
+        QueueConfig,
+        RendererConfig,
+        RendererType,
+    )
+    from .processors import (
+        DROP,
+        ColoredRenderer,
+        DropLog,
+        JSONRenderer,
+        PlainRenderer,
+        add_callsite_params,
+        add_context_defaults,
+        colored_renderer,
+        dict_tracebacks,
+        filter_by_level,
+        filter_keys,
+        filter_markup,
+        json_renderer,
+        plain_renderer,
+    )
+    from .record import LogRecord
+    from .types import (
+        Context,
+        EventDict,
+        FuncProcessor,
+        FuncRenderer,
+        Processor,
+        Renderer,
+        WrappedLogger,
+    )
 
 __all__ = [
     # Bridge
@@ -138,6 +145,7 @@ __all__ = [
     "json_renderer",
     "plain_renderer",
     # Processors
+    "DROP",
     "DropLog",
     "add_callsite_params",
     "add_context_defaults",
@@ -156,3 +164,98 @@ __all__ = [
     "Renderer",
     "WrappedLogger",
 ]
+
+# Public names are resolved on first access (PEP 562) so importing `ko_log` does not
+# pay for importing every submodule upfront
+_LAZY: dict[str, str] = {
+    # Bridge
+    "BoundLoggerBase": "bridge",
+    # Exceptions
+    "AlConfigurationError": "exceptions",
+    "AlHandlerError": "exceptions",
+    "AlLoggerCreationError": "exceptions",
+    "AlProcessorError": "exceptions",
+    "AlQueueManagerError": "exceptions",
+    # Factory
+    "LoggerFactory": "factory",
+    # Handlers
+    "AsyncFileHandler": "handlers",
+    "AsyncNullHandler": "handlers",
+    "AsyncRotatingFileHandler": "handlers",
+    "AsyncStreamHandler": "handlers",
+    "Handler": "handlers",
+    "Sink": "handlers",
+    "file_handler": "handlers",
+    "null_handler": "handlers",
+    "rotating_file_handler": "handlers",
+    "stream_handler": "handlers",
+    # Levels
+    "LogLevel": "levels",
+    "LogLevels": "levels",
+    # Manager
+    "QueueManager": "manager",
+    # Models
+    "AddCallsiteParamsConfig": "models",
+    "AddContextDefaultConfig": "models",
+    "AsyncFileHandlerConfig": "models",
+    "AsyncStreamHandlerConfig": "models",
+    "CallsiteParameter": "models",
+    "ColoredStreamRendererConfig": "models",
+    "DictTracebacksConfig": "models",
+    "FilterByLevelConfig": "models",
+    "FilterKeysConfig": "models",
+    "FilterMarkupConfig": "models",
+    "HandlerConfig": "models",
+    "HandlerType": "models",
+    "JSONFileRendererConfig": "models",
+    "JSONStreamRendererConfig": "models",
+    "LoggerConfig": "models",
+    "LoggingSystemConfig": "models",
+    "NullHandlerConfig": "models",
+    "PlainFileRendererConfig": "models",
+    "PlainStreamRendererConfig": "models",
+    "ProcessorConfig": "models",
+    "ProcessorType": "models",
+    "QueueConfig": "models",
+    "RendererConfig": "models",
+    "RendererType": "models",
+    # Processors
+    "ColoredRenderer": "processors",
+    "DROP": "processors",
+    "DropLog": "processors",
+    "JSONRenderer": "processors",
+    "PlainRenderer": "processors",
+    "add_callsite_params": "processors",
+    "add_context_defaults": "processors",
+    "colored_renderer": "processors",
+    "dict_tracebacks": "processors",
+    "filter_by_level": "processors",
+    "filter_keys": "processors",
+    "filter_markup": "processors",
+    "json_renderer": "processors",
+    "plain_renderer": "processors",
+    # Record
+    "LogRecord": "record",
+    # Types
+    "Context": "types",
+    "EventDict": "types",
+    "FuncProcessor": "types",
+    "FuncRenderer": "types",
+    "Processor": "types",
+    "Renderer": "types",
+    "WrappedLogger": "types",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name: str | None = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module `{__name__}` has no attribute `{name}`")
+
+    value: object = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,19 +1,26 @@
-import inspect
 import os
 import sys
 import threading
+import time
+import weakref
 from _io import FileIO
-from _thread import lock
-from datetime import datetime, timezone
-from inspect import Traceback
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
-from types import FrameType, ModuleType
+from queue import Empty, SimpleQueue
+from types import CodeType, FrameType
+from typing import Literal, TypeAlias
 
 from aiofiles.threadpool import binary
 
 from .levels import LogLevel
 from .types import Context, EventDict, ExcInfo, FileTextMode
-from .utils import validate_file_path
+from .utils import resolve_encoder, split_code_filename, validate_file_path
+
+_HAS_WRITEV: bool = hasattr(os, "writev")
+
+_QueueItem: TypeAlias = bytes | threading.Event | None
+"""Encoded line, flush request, or the `None` shutdown sentinel."""
 
 # =====================================================================================
 #   Internal logger of `LoggerFactory`
@@ -21,7 +28,13 @@ from .utils import validate_file_path
 
 
 class InternalLog:
-    """Logs process of creating loggers from configurations."""
+    """
+    Logs process of creating loggers from configurations.
+
+    Lines are encoded here and written by a `_LineWriter` thread. `close()` stops
+    it; otherwise it is stopped once this log is garbage collected, or at
+    interpreter exit.
+    """
 
     def __init__(
         self,
@@ -33,16 +46,19 @@ class InternalLog:
             path=filename, create_missing_dir=True
         )
         self._file: binary.AsyncFileIO | None = None
-        self._file_sync: FileIO | None = None
         self._mode: FileTextMode = mode
         self._encoding: str = encoding
 
-        self._fmt: str = (
-            "[%(asctime)s] [%(level)-8s] [%(lineno)-4s::%(funcName)s] %(event)s"
-        )
-        self._datefmt: str = "%Y-%m-%d %H:%M:%S"
+        self._encode: Callable[[str], bytes] = resolve_encoder(encoding)
+
+        self._asctime_cache: tuple[int, str] = (-1, "")
 
-        self._lock: lock = threading.Lock()
+        self._writer: _LineWriter = _LineWriter(self._filepath, mode)
+        # The writer thread holds no reference back to this log, so it can be
+        # collected; runs at most once, and at interpreter exit if still pending
+        self._finalizer: weakref.finalize[[], None] = weakref.finalize(
+            self, self._writer.close
+        )
 
     # ---------------------------------------------------------------------------------
     #   Logging methods
@@ -88,51 +104,216 @@ class InternalLog:
         self._log(event_dict)
 
     def _log(self, event_dict: EventDict) -> None:
-        date: datetime = event_dict.pop(  # pyright: ignore[reportAny]
-            "timestamp", datetime.now(tz=timezone.utc)
+        date: datetime | None = event_dict.pop(  # pyright: ignore[reportAny]
+            "timestamp", None
+        )
+        event_dict["asctime"] = self._fmt_asctime(
+            time.time() if date is None else date.timestamp()
         )
-        event_dict["asctime"] = date.strftime(format=self._datefmt)
-        event_dict["event"] = self._fmt % event_dict
+        event_dict["event"] = self._render(event_dict)
 
         self._write(msg=event_dict["event"])
 
+    @staticmethod
+    def _render(event_dict: EventDict) -> str:
+        """
+        Specialized form of the fixed format
+        `[%(asctime)s] [%(level)-8s] [%(lineno)-4s::%(funcName)s] %(event)s`.
+        """
+
+        return (
+            f"[{event_dict['asctime']}] [{event_dict['level']:<8}]"
+            f" [{event_dict['lineno']:<4}::{event_dict['funcName']}]"
+            f" {event_dict['event']}"
+        )
+
+    def _fmt_asctime(self, timestamp: float) -> str:
+        """
+        UTC `%Y-%m-%d %H:%M:%S` of `timestamp`; only formatted once per second, as
+        every other record within the same second reuses the cached string.
+        """
+
+        second: int = int(timestamp)
+        cached_second, cached_asctime = self._asctime_cache
+        if second == cached_second:
+            return cached_asctime
+
+        tm: time.struct_time = time.gmtime(second)
+        asctime: str = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f" {tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        )
+        # Swapped as one tuple so concurrent callers never see a torn pair
+        self._asctime_cache = (second, asctime)
+        return asctime
+
     # ---------------------------------------------------------------------------------
     #   Helper/Private methods
     # ---------------------------------------------------------------------------------
 
     def _extract_caller_info(self, frame: FrameType) -> dict[str, str]:
-        frame_info: Traceback = inspect.getframeinfo(frame)
-        module: ModuleType | None = inspect.getmodule(object=frame)
+        code: CodeType = frame.f_code
+        pathname, filename = split_code_filename(code.co_filename)
 
         return {
-            "pathname": os.path.abspath(path=frame_info.filename),
-            "filename": Path(frame_info.filename).name,
-            "lineno": str(frame_info.lineno),
-            "funcName": frame_info.function,
-            "module": module.__name__ if module else "unknown",
+            "pathname": pathname,
+            "filename": filename,
+            "lineno": str(frame.f_lineno),
+            "funcName": code.co_name,
+            "module": frame.f_globals.get("__name__", "unknown"),
         }
 
     def _is_exception(self, level: str, **kwargs: Context) -> ExcInfo | None:
         if level in ("ERROR", "CRITICAL"):
             return sys.exc_info()
-        elif ("exc_info" not in kwargs) and (sys.exc_info()[0] is not None):
-            return sys.exc_info()
-        else:
+        # Any other level still picks up an exception being handled, unless given one
+        elif ("exc_info" in kwargs) or (sys.exception() is None):
             return None
+        else:
+            return sys.exc_info()
+
+    def flush(self) -> None:
+        """Block until every line enqueued so far is written to the file."""
+
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write pending lines, stop the writer thread, and close the file handle."""
+
+        self._finalizer()
 
     def _write(self, msg: str) -> None:
-        line: str = msg + "\n"
+        self._writer.put(self._encode(msg + "\n"))
+
+
+# =====================================================================================
+#   Writer thread of `InternalLog`
+# =====================================================================================
+
+
+class _LineWriter:
+    """
+    Callers only enqueue encoded lines. A dedicated writer thread collects them
+    and hands the whole batch to one `os.writev` call once it reaches
+    `_BATCH_BYTES` or `_BATCH_LINES`, once `_FLUSH_INTERVAL` seconds have passed
+    since the first line of the batch, on `flush()`, or on `close()`.
+
+    A batch that fails to write is reported on `stderr` and dropped, so the
+    thread keeps serving later lines and flush requests.
+    """
+
+    _BATCH_BYTES: int = 64 * 1024
+    _BATCH_LINES: int = 1024  # `IOV_MAX` on Linux and macOS
+    _FLUSH_INTERVAL: float = 0.005
+
+    def __init__(self, filepath: Path, mode: FileTextMode) -> None:
+        self._filepath: Path = filepath
+        self._mode: FileTextMode = mode
+        self._file_sync: FileIO | None = None
+        self._fd: int = -1
+
+        # Only ever touched by the writer thread (or after it has been joined)
+        self._pending: list[bytes] = []
+        self._pending_size: int = 0
+
+        self._closed: bool = False
+        self._queue: SimpleQueue[_QueueItem] = SimpleQueue()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._drain, name=InternalLog.__name__, daemon=True
+        )
+        self._thread.start()
+
+    def put(self, line: bytes) -> None:
+        if self._closed:  # Nothing would ever drain it
+            return
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        if self._closed:
+            return
+        done: threading.Event = threading.Event()
+        self._queue.put(done)
+        # Bounded waits, in case the thread is gone (e.g. killed at shutdown)
+        while not done.wait(timeout=0.1):
+            if not self._thread.is_alive():
+                return
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._file_sync is not None:
+            self._file_sync.close()
+            self._file_sync = None
+            self._fd = -1
+
+    def _drain(self) -> None:
+        """Writer thread loop; runs until the `None` sentinel is received."""
+
+        while True:
+            item: _QueueItem | Literal[False] = self._queue.get()
+            deadline: float = time.monotonic() + self._FLUSH_INTERVAL
+            try:
+                while isinstance(item, bytes):
+                    self._pending.append(item)
+                    self._pending_size += len(item)
+                    item = self._next_line(deadline)
+                self._flush_batch()
+            except Exception as exc:
+                self._pending.clear()
+                self._pending_size = 0
+                print(
+                    f"{InternalLog.__name__}: dropped lines that failed to write"
+                    + f" to `{self._filepath}`: {exc!r}",
+                    file=sys.stderr,
+                )
+            finally:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+            if item is None:
+                return
+
+    def _next_line(self, deadline: float) -> _QueueItem | Literal[False]:
+        """Next queued item of the current batch, or `False` once it is complete."""
+
+        timeout: float = deadline - time.monotonic()
+        if (
+            (self._pending_size >= self._BATCH_BYTES)
+            or (len(self._pending) >= self._BATCH_LINES)
+            or (timeout <= 0)
+        ):
+            return False
+        try:
+            return self._queue.get(timeout=timeout)
+        except Empty:
+            return False
+
+    def _flush_batch(self) -> None:
+        """Write the pending lines with a single gathering syscall."""
+
+        if not self._pending:
+            return
 
         if self._file_sync is None:
             self._open_sync()
-        assert self._file_sync is not None
 
-        with self._lock:
-            _ = self._file_sync.write(line.encode(encoding=self._encoding))
-            self._file_sync.flush()
+        fd: int = self._fd
+        total: int = self._pending_size
+        written: int = os.writev(fd, self._pending) if _HAS_WRITEV else 0
+        if written < total:  # Short write, or no `writev` on this platform
+            with memoryview(b"".join(self._pending)) as view:
+                while written < total:
+                    written += os.write(fd, view[written:])
+        self._pending.clear()
+        self._pending_size = 0
 
     def _open_sync(self) -> None:
         self._file_sync = self._filepath.open(
             self._mode,
             buffering=0,
         )
+        self._fd = self._file_sync.fileno()
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
-import asyncio
-import inspect
-import os
 import sys
-import time
-from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
-from contextlib import asynccontextmanager, contextmanager
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+)
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
 from datetime import datetime, timezone
-from inspect import Traceback
-from pathlib import Path
-from types import FrameType, ModuleType
+from time import perf_counter
+from types import CodeType, FrameType
 from typing import Self, final, override
 
 from .exceptions import AlLoggerError, AlProcessorError
-from .levels import LogLevel
+from .levels import NAME_TO_LEVEL, LogLevel, LogLevels, check_level
 from .manager import QueueManager
+from .processors import DROP
 from .record import LogRecord
 from .types import (
     Context,
     ContextScalar,
+    Drop,
     EventDict,
     ExcInfo,
     LogContext,
     Processor,
     WrappedLogger,
 )
+from .utils import split_code_filename
+
+# Thresholds compared against `BoundLoggerBase._min_level` on every log call
+_DEBUG: int = NAME_TO_LEVEL[LogLevel.DEBUG]
+_INFO: int = NAME_TO_LEVEL[LogLevel.INFO]
+_WARNING: int = NAME_TO_LEVEL[LogLevel.WARNING]
+_ERROR: int = NAME_TO_LEVEL[LogLevel.ERROR]
+_CRITICAL: int = NAME_TO_LEVEL[LogLevel.CRITICAL]
 
 # =====================================================================================
 #   Base logger
@@ -39,6 +56,11 @@ class QueueLoggerWrapper:
     It is wrapped by `BoundLoggerBase` to serve as the interface for logging.
     """
 
+    __slots__ = (
+        "name",
+        "_queue",
+    )
+
     name: str
 
     def __init__(self, name: str, queue_manager: QueueManager):
@@ -48,7 +70,6 @@ class QueueLoggerWrapper:
     def log(self, event_dict: EventDict) -> None:
         """Internal log method that creates the `LogRecord`."""
 
-        event_dict["name"] = self.name
         event_dict["timestamp"] = datetime.now(tz=timezone.utc)
         record: LogRecord = LogRecord.create(event_dict)
         self._queue.push_sync(record)
@@ -56,7 +77,6 @@ class QueueLoggerWrapper:
     async def async_log(self, event_dict: EventDict) -> None:
         """Internal async log method that creates the `LogRecord`."""
 
-        event_dict["name"] = self.name
         event_dict["timestamp"] = datetime.now(tz=timezone.utc)
         record: LogRecord = LogRecord.create(event_dict)
         await self._queue.enqueue(record)
@@ -70,6 +90,18 @@ class QueueLoggerWrapper:
 class BoundLoggerBase:
     """Immutable context carrier. This doesn't do any actual logging."""
 
+    # Fixed attribute layout; every record reads most of these
+    __slots__ = (
+        "_logger",
+        "_processors",
+        "_context",
+        "_min_level",
+        "_name",
+        "_emit",
+        "_aemit",
+        "__weakref__",
+    )
+
     _logger: WrappedLogger
 
     def __init__(
@@ -77,10 +109,19 @@ class BoundLoggerBase:
         logger: WrappedLogger,
         processors: list[Processor],
         context: LogContext,
+        *,
+        min_level: LogLevels = LogLevel.NOTSET,
     ) -> None:
         self._logger = logger
         self._processors: list[Processor] = processors
         self._context: LogContext = context
+        # Records below this are dropped before any event dict is built
+        self._min_level: int = check_level(level=min_level)
+
+        # Resolved once so each record skips the `self._logger.*` lookup chain
+        self._name: str = logger.name
+        self._emit: Callable[[EventDict], None] = logger.log
+        self._aemit: Callable[[EventDict], Awaitable[None]] = logger.async_log
 
     @override
     def __repr__(self) -> str:
@@ -103,105 +144,205 @@ class BoundLoggerBase:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    # ---------------------------------------------------------------------------------
+    #   Scope and lifecycle context managers
+    # ---------------------------------------------------------------------------------
+
+    @contextmanager
+    def _scope(self, level: LogLevel, event: str, ctx: LogContext) -> Iterator[Self]:
+        """
+        Logs entry (and errors) of a synchronous scope at `level`.
+
+        Yields:
+            `BoundLoggerBase`: The current logger instance.
+        """
+
+        if self._min_level > NAME_TO_LEVEL[level]:
+            yield self
+            return
+
+        self._sync_log(event, level, 3, ctx)
+        try:
+            yield self
+        except BaseException as exc:
+            ctx = {**ctx, "exc_info": exc}  # Earlier records may share `ctx`
+            self._sync_log("Error in a scope", level, 3, ctx)
+            raise
+
+    @asynccontextmanager
+    async def _ascope(
+        self, level: LogLevel, event: str, ctx: LogContext
+    ) -> AsyncIterator[Self]:
+        """
+        Logs entry (and errors) of an asynchronous scope at `level`.
+
+        Yields:
+            `BoundLoggerBase`: The current logger instance.
+        """
+
+        if self._min_level > NAME_TO_LEVEL[level]:
+            yield self
+            return
+
+        await self._async_log(event, level, 3, ctx)
+        try:
+            yield self
+        except BaseException as exc:
+            ctx = {**ctx, "exc_info": exc}  # Earlier records may share `ctx`
+            await self._async_log("Error in a scope", level, 3, ctx)
+            raise
+
+    @contextmanager
+    def _life(
+        self, level: LogLevel, scope: str, ctx: LogContext
+    ) -> Generator[Self, None, None]:
+        """
+        Logs lifecycle entry and exit of a synchronous scope at `level`.
+
+        Yields:
+            `BoundLoggerBase`: The current logger instance.
+        """
+
+        if self._min_level > NAME_TO_LEVEL[level]:
+            yield self
+            return
+
+        self._sync_log(f"Begin: {scope}", level, 3, ctx)
+        start: float = perf_counter()
+        try:
+            yield self
+        except BaseException as exc:
+            ctx = {**ctx, "exc_info": exc}  # Earlier records may share `ctx`
+            self._sync_log(f"Error in {scope}", level, 3, ctx)
+            raise
+        finally:
+            duration: float = perf_counter() - start
+            self._sync_log(f"End ({duration:.2f}): {scope}", level, 3, ctx)
+
+    @asynccontextmanager
+    async def _alife(
+        self, level: LogLevel, scope: str, ctx: LogContext
+    ) -> AsyncGenerator[Self, None]:
+        """
+        Logs lifecycle entry and exit of an asynchronous scope at `level`.
+
+        Yields:
+            `BoundLoggerBase`: The current logger instance.
+        """
+
+        if self._min_level > NAME_TO_LEVEL[level]:
+            yield self
+            return
+
+        await self._async_log(f"Begin: {scope}", level, 3, ctx)
+        start: float = perf_counter()
+        try:
+            yield self
+        except BaseException as exc:
+            ctx = {**ctx, "exc_info": exc}  # Earlier records may share `ctx`
+            await self._async_log(f"Error in {scope}", level, 3, ctx)
+            raise
+        finally:
+            duration: float = perf_counter() - start
+            await self._async_log(f"End ({duration:.2f}): {scope}", level, 3, ctx)
+
     # ---------------------------------------------------------------------------------
     #   Logging methods
     # ---------------------------------------------------------------------------------
 
     def debug(self, event: str, /, **context: Context) -> None:
-        self._sync_log(event, level=LogLevel.DEBUG, frame_count=2, **context)
+        if self._min_level > _DEBUG:
+            return
+        self._sync_log(event, LogLevel.DEBUG, 2, context)
 
     async def adebug(self, event: str, /, **context: Context) -> None:
-        await self._async_log(event, level=LogLevel.DEBUG, frame_count=2, **context)
+        if self._min_level > _DEBUG:
+            return
+        await self._async_log(event, LogLevel.DEBUG, 2, context)
 
-    @contextmanager
-    def debug_scope(self, event: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_scope(event, level=LogLevel.DEBUG, **context) as logger:
-            yield logger
+    def debug_scope(
+        self, event: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._scope(LogLevel.DEBUG, event, context)
 
-    @asynccontextmanager
-    async def adebug_scope(
+    def adebug_scope(
         self, event: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_scope(event, level=LogLevel.DEBUG, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._ascope(LogLevel.DEBUG, event, context)
 
-    @contextmanager
-    def debug_life(self, scope: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_life(scope, level=LogLevel.DEBUG, **context) as logger:
-            yield logger
+    def debug_life(
+        self, scope: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._life(LogLevel.DEBUG, scope, context)
 
-    @asynccontextmanager
-    async def adebug_life(
+    def adebug_life(
         self, scope: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_life(scope, level=LogLevel.DEBUG, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._alife(LogLevel.DEBUG, scope, context)
 
     # ---------------------------------------------------------------------------------
 
     def info(self, event: str, /, **context: Context) -> None:
-        self._sync_log(event, level=LogLevel.INFO, frame_count=2, **context)
+        if self._min_level > _INFO:
+            return
+        self._sync_log(event, LogLevel.INFO, 2, context)
 
     async def ainfo(self, event: str, /, **context: Context) -> None:
-        await self._async_log(event, level=LogLevel.INFO, frame_count=2, **context)
+        if self._min_level > _INFO:
+            return
+        await self._async_log(event, LogLevel.INFO, 2, context)
 
-    @contextmanager
-    def info_scope(self, event: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_scope(event, level=LogLevel.INFO, **context) as logger:
-            yield logger
+    def info_scope(
+        self, event: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._scope(LogLevel.INFO, event, context)
 
-    @asynccontextmanager
-    async def ainfo_scope(
+    def ainfo_scope(
         self, event: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_scope(event, level=LogLevel.INFO, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._ascope(LogLevel.INFO, event, context)
 
-    @contextmanager
-    def info_life(self, scope: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_life(scope, level=LogLevel.INFO, **context) as logger:
-            yield logger
+    def info_life(
+        self, scope: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._life(LogLevel.INFO, scope, context)
 
-    @asynccontextmanager
-    async def ainfo_life(
+    def ainfo_life(
         self, scope: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_life(scope, level=LogLevel.INFO, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._alife(LogLevel.INFO, scope, context)
 
     # ---------------------------------------------------------------------------------
 
     def warning(self, event: str, /, **context: Context) -> None:
-        self._sync_log(event, level=LogLevel.WARNING, frame_count=2, **context)
+        if self._min_level > _WARNING:
+            return
+        self._sync_log(event, LogLevel.WARNING, 2, context)
 
     async def awarning(self, event: str, /, **context: Context) -> None:
-        await self._async_log(event, level=LogLevel.WARNING, frame_count=2, **context)
+        if self._min_level > _WARNING:
+            return
+        await self._async_log(event, LogLevel.WARNING, 2, context)
 
-    @contextmanager
-    def warning_scope(self, event: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_scope(event, level=LogLevel.WARNING, **context) as logger:
-            yield logger
+    def warning_scope(
+        self, event: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._scope(LogLevel.WARNING, event, context)
 
-    @asynccontextmanager
-    async def awarning_scope(
+    def awarning_scope(
         self, event: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_scope(
-            event, level=LogLevel.WARNING, **context
-        ) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._ascope(LogLevel.WARNING, event, context)
 
-    @contextmanager
-    def warning_life(self, scope: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_life(scope, level=LogLevel.WARNING, **context) as logger:
-            yield logger
+    def warning_life(
+        self, scope: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._life(LogLevel.WARNING, scope, context)
 
-    @asynccontextmanager
-    async def awarning_life(
+    def awarning_life(
         self, scope: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_life(scope, level=LogLevel.WARNING, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._alife(LogLevel.WARNING, scope, context)
 
     # ---------------------------------------------------------------------------------
 
@@ -217,70 +358,66 @@ class BoundLoggerBase:
     # ---------------------------------------------------------------------------------
 
     def error(self, event: str, /, **context: Context) -> None:
-        self._sync_log(event, level=LogLevel.ERROR, frame_count=2, **context)
+        if self._min_level > _ERROR:
+            return
+        self._sync_log(event, LogLevel.ERROR, 2, context)
 
     async def aerror(self, event: str, /, **context: Context) -> None:
-        await self._async_log(event, level=LogLevel.ERROR, frame_count=2, **context)
+        if self._min_level > _ERROR:
+            return
+        await self._async_log(event, LogLevel.ERROR, 2, context)
 
-    @contextmanager
-    def error_scope(self, event: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_scope(event, level=LogLevel.ERROR, **context) as logger:
-            yield logger
+    def error_scope(
+        self, event: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._scope(LogLevel.ERROR, event, context)
 
-    @asynccontextmanager
-    async def aerror_scope(
+    def aerror_scope(
         self, event: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_scope(event, level=LogLevel.ERROR, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._ascope(LogLevel.ERROR, event, context)
 
-    @contextmanager
-    def error_life(self, scope: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_life(scope, level=LogLevel.ERROR, **context) as logger:
-            yield logger
+    def error_life(
+        self, scope: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._life(LogLevel.ERROR, scope, context)
 
-    @asynccontextmanager
-    async def aerror_life(
+    def aerror_life(
         self, scope: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_life(scope, level=LogLevel.ERROR, **context) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._alife(LogLevel.ERROR, scope, context)
 
     # ---------------------------------------------------------------------------------
 
     def critical(self, event: str, /, **context: Context) -> None:
-        self._sync_log(event, level=LogLevel.CRITICAL, frame_count=2, **context)
+        if self._min_level > _CRITICAL:
+            return
+        self._sync_log(event, LogLevel.CRITICAL, 2, context)
 
     async def acritical(self, event: str, /, **context: Context) -> None:
-        await self._async_log(event, level=LogLevel.CRITICAL, frame_count=2, **context)
+        if self._min_level > _CRITICAL:
+            return
+        await self._async_log(event, LogLevel.CRITICAL, 2, context)
 
-    @contextmanager
-    def critical_scope(self, event: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_scope(event, level=LogLevel.CRITICAL, **context) as logger:
-            yield logger
+    def critical_scope(
+        self, event: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._scope(LogLevel.CRITICAL, event, context)
 
-    @asynccontextmanager
-    async def acritical_scope(
+    def acritical_scope(
         self, event: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_scope(
-            event, level=LogLevel.CRITICAL, **context
-        ) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._ascope(LogLevel.CRITICAL, event, context)
 
-    @contextmanager
-    def critical_life(self, scope: str, /, **context: Context) -> Generator[Self]:
-        with self._sync_life(scope, level=LogLevel.CRITICAL, **context) as logger:
-            yield logger
+    def critical_life(
+        self, scope: str, /, **context: Context
+    ) -> AbstractContextManager[Self]:
+        return self._life(LogLevel.CRITICAL, scope, context)
 
-    @asynccontextmanager
-    async def acritical_life(
+    def acritical_life(
         self, scope: str, /, **context: Context
-    ) -> AsyncGenerator[Self]:
-        async with self._async_life(
-            scope, level=LogLevel.CRITICAL, **context
-        ) as logger:
-            yield logger
+    ) -> AbstractAsyncContextManager[Self]:
+        return self._alife(LogLevel.CRITICAL, scope, context)
 
     # ---------------------------------------------------------------------------------
 
@@ -293,108 +430,6 @@ class BoundLoggerBase:
     afatal_life = acritical_life  # pyright: ignore[reportUnannotatedClassAttribute]
     # fmt: on
 
-    # ---------------------------------------------------------------------------------
-    #   Internal logger helpers
-    # ---------------------------------------------------------------------------------
-
-    @contextmanager
-    def _sync_scope(self, event: str, level: str, **ctx: Context) -> Iterator[Self]:
-        """
-        Logs for synchronous scopes.
-
-        Yields:
-            `BoundLoggerBase`: The current logger instance.
-        """
-
-        self._sync_log(event, level, frame_count=5, **ctx)
-        try:
-            yield self
-        except BaseException as exc:
-            ctx["exc_info"] = exc
-            self._sync_log(event="Error in a scope", level=level, frame_count=5, **ctx)
-            raise
-
-    @asynccontextmanager
-    async def _async_scope(
-        self, event: str, level: str, **ctx: Context
-    ) -> AsyncIterator[Self]:
-        """
-        Logs for asynchronous scopes.
-
-        Yields:
-            `BoundLoggerBase`: The current logger instance.
-        """
-
-        await self._async_log(event, level, frame_count=5, **ctx)
-        try:
-            yield self
-        except BaseException as exc:
-            ctx["exc_info"] = exc
-            await self._async_log(
-                event="Error in a scope", level=level, frame_count=5, **ctx
-            )
-            raise
-
-    @contextmanager
-    def _sync_life(
-        self, scope: str, level: str, **ctx: Context
-    ) -> Generator[Self, None, None]:
-        """
-        Logs lifecycle entry and exit for synchronous scopes.
-
-        Yields:
-            `BoundLoggerBase`: The current logger instance.
-        """
-
-        self._sync_log(event=f"Begin: {scope}", level=level, frame_count=5, **ctx)
-        start: float = time.perf_counter()
-        try:
-            yield self
-        except BaseException as exc:
-            ctx["exc_info"] = exc
-            self._sync_log(event=f"Error in {scope}", level=level, frame_count=5, **ctx)
-            raise
-        finally:
-            duration: float = time.perf_counter() - start
-            self._sync_log(
-                event=f"End ({duration:.2f}): {scope}",
-                level=level,
-                frame_count=5,
-                **ctx,
-            )
-
-    @asynccontextmanager
-    async def _async_life(
-        self, scope: str, level: str, **ctx: Context
-    ) -> AsyncGenerator[Self, None]:
-        """
-        Logs lifecycle entry and exit for asynchronous scopes.
-
-        Yields:
-            `BoundLoggerBase`: The current logger instance.
-        """
-
-        await self._async_log(
-            event=f"Begin: {scope}", level=level, frame_count=5, **ctx
-        )
-        start: float = time.perf_counter()
-        try:
-            yield self
-        except BaseException as exc:
-            ctx["exc_info"] = exc
-            await self._async_log(
-                event=f"Error in {scope}", level=level, frame_count=5, **ctx
-            )
-            raise
-        finally:
-            duration: float = time.perf_counter() - start
-            await self._async_log(
-                event=f"End ({duration:.2f}): {scope}",
-                level=level,
-                frame_count=5,
-                **ctx,
-            )
-
     # ---------------------------------------------------------------------------------
     #   Binding methods
     # ---------------------------------------------------------------------------------
@@ -402,10 +437,18 @@ class BoundLoggerBase:
     def bind(self, **new_values: ContextScalar) -> Self:
         """Return a new logger with `new_values` added to context."""
 
+        # A dict display copies both mappings in one pass; calling the class goes
+        # through an intermediate kwargs dict first
+        context: LogContext = self._context
         return self.__class__(
             self._logger,
             self._processors,
-            self._context.__class__(**self._context, **new_values),
+            (
+                {**context, **new_values}
+                if context.__class__ is dict
+                else context.__class__(**context, **new_values)
+            ),
+            min_level=self._min_level,
         )
 
     def unbind(self, *keys: str) -> Self:
@@ -437,7 +480,8 @@ class BoundLoggerBase:
         wrapped by `structlog.threadlocal.wrap_dict` when threads are reused.
         """
 
-        self._context.clear()
+        # Rebound rather than cleared, so whoever else holds the old dict keeps it
+        self._context = self._context.__class__()
         return self.bind(**new_values)
 
     # ---------------------------------------------------------------------------------
@@ -449,74 +493,102 @@ class BoundLoggerBase:
         event: str,
         level: str,
         frame_count: int = 2,
-        **ctx: Context,
+        ctx: LogContext | None = None,
     ) -> None:
         frame: FrameType = sys._getframe(  # pyright: ignore[reportPrivateUsage]
             frame_count
         )
-        event_dict: EventDict = {
-            "name": self._logger.name,
-            "event": event,
-            "level": level,
-            "exc_info": self._is_exception(level, **ctx),
-            **self._extract_caller_info(frame),
-            "context": {**self._context.copy(), **ctx},
-        }
-        event_dict = self._process_events(event, event_dict=event_dict.copy())
-        self._logger.log(event_dict)
+        event_dict: EventDict | Drop = self._make_event_dict(event, level, frame, ctx)
+        if self._processors:
+            event_dict = self._process_events(event, event_dict=event_dict)
+            if event_dict is DROP:
+                return
+        self._emit(event_dict)
 
     async def _async_log(
         self,
         event: str,
         level: str,
         frame_count: int = 2,
-        **ctx: Context,
+        ctx: LogContext | None = None,
     ) -> None:
         frame: FrameType = sys._getframe(  # pyright: ignore[reportPrivateUsage]
             frame_count
         )
-        caller_info: dict[str, str] = await asyncio.to_thread(
-            lambda: self._extract_caller_info(frame)
-        )
-        event_dict: EventDict = {
-            "name": self._logger.name,
+        event_dict: EventDict | Drop = self._make_event_dict(event, level, frame, ctx)
+        if self._processors:
+            event_dict = self._process_events(event, event_dict=event_dict)
+            if event_dict is DROP:
+                return
+        await self._aemit(event_dict)
+
+    def _make_event_dict(
+        self, event: str, level: str, frame: FrameType, ctx: LogContext | None
+    ) -> EventDict:
+        """
+        Build the complete `EventDict` in one literal, with every key the wrapped
+        logger expects. `timestamp` is owned and filled in by the wrapped logger.
+        """
+
+        # Callsite is read straight off the frame; `inspect.getframeinfo()` loads
+        # source lines through `linecache` and `inspect.getmodule()` scans
+        # `sys.modules`
+        code: CodeType = frame.f_code
+        pathname, filename = split_code_filename(code.co_filename)
+
+        return {
+            "name": self._name,
             "event": event,
             "level": level,
-            "exc_info": self._is_exception(level, **ctx),
-            **caller_info,
-            "context": {**self._context.copy(), **ctx},
+            "exc_info": self._is_exception(level, ctx),
+            "pathname": pathname,
+            "filename": filename,
+            "lineno": str(frame.f_lineno),
+            "funcName": code.co_name,
+            "module": frame.f_globals.get("__name__", "unknown"),
+            "context": self._merge_context(ctx),
+            "timestamp": None,
         }
-        event_dict = self._process_events(event, event_dict=event_dict.copy())
-        await self._logger.async_log(event_dict)
 
-    def _extract_caller_info(self, frame: FrameType) -> dict[str, str]:
-        frame_info: Traceback = inspect.getframeinfo(frame)
-        module: ModuleType | None = inspect.getmodule(object=frame)
+    def _process_events(self, event: str, event_dict: EventDict) -> EventDict | Drop:
+        """
+        Run the logger's processors over `event_dict`.
 
-        return {
-            "pathname": os.path.abspath(path=frame_info.filename),
-            "filename": Path(frame_info.filename).name,
-            "lineno": str(frame_info.lineno),
-            "funcName": frame_info.function,
-            "module": module.__name__ if module else "unknown",
-        }
+        Processors may mutate `event_dict` in place; it is built fresh per record,
+        so callers must not reuse it afterwards. Returns `DROP` as soon as a
+        processor drops the log.
+        """
 
-    def _process_events(self, event: str, event_dict: EventDict) -> EventDict:
         event_dict["event"] = event
-        for processor in self._processors:
-            try:
-                event_dict = processor(event_dict)
-            except AlProcessorError as exc:
-                raise AlLoggerError(
-                    "Failed to finish processing the message through top-level processors",
-                    service=self.__class__.__name__,
-                ) from exc
-        return event_dict
-
-    def _is_exception(self, level: str, **kwargs: Context) -> ExcInfo | None:
+        processed: EventDict | Drop = event_dict
+        # One handler around the whole chain, as `Handler._fmt_msg()` does
+        try:
+            for processor in self._processors:
+                processed = processor(processed)
+                if processed is DROP:
+                    break
+        except AlProcessorError as exc:
+            raise AlLoggerError(
+                "Failed to finish processing the message through top-level processors",
+                service=self.__class__.__name__,
+            ) from exc
+        return processed
+
+    def _merge_context(self, ctx: LogContext | None) -> LogContext:
+        """
+        Bound context merged with per-call `ctx`, as a dict of the record's own;
+        processors may mutate it, and scopes reuse `ctx` across records.
+        """
+
+        if not ctx:
+            return {**self._context}
+        return {**self._context, **ctx}
+
+    def _is_exception(self, level: str, ctx: LogContext | None) -> ExcInfo | None:
         if level in ("ERROR", "CRITICAL"):
             return sys.exc_info()
-        elif ("exc_info" not in kwargs) and (sys.exc_info()[0] is not None):
-            return sys.exc_info()
-        else:
+        # Any other level still picks up an exception being handled, unless given one
+        elif (ctx and ("exc_info" in ctx)) or (sys.exception() is None):
             return None
+        else:
+            return sys.exc_info()
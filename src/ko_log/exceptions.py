@@ -1,7 +1,10 @@
-import json
+import functools
+import time
 from datetime import datetime, timezone
 from typing import Literal, TypeAlias, override
 
+from .utils import dumps_indented
+
 # ======================================================================================
 #   Models
 # ======================================================================================
@@ -44,6 +47,8 @@ Severity: TypeAlias = Literal["WARNING", "ERROR", "CRITICAL"]
 """Error severity levels."""
 # fmt: on
 
+_RECOVERABLE: str = "::RECOVERABLE"
+
 
 # ======================================================================================
 #   Base
@@ -57,6 +62,19 @@ class _BaseException(BaseException):
     default_category: Category = "UNKNOWN"
     default_severity: Severity = "ERROR"
     recoverable: bool | None = None
+    _default_code: str = "UNKNOWN::unknown::UNKNOWN::ERROR"
+    """Code built from the `default_*` values; recomputed for every subclass."""
+
+    @override
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_code = cls._generate_code(
+            layer=cls.default_layer,
+            service=cls.default_service,
+            category=cls.default_category,
+            severity=cls.default_severity,
+            recoverable=bool(cls.recoverable),
+        )
 
     def __init__(
         self,
@@ -77,32 +95,64 @@ class _BaseException(BaseException):
         self.msg = message.strip()
         self.user_msg: str = user_message.strip() if user_message else ""
 
-        layer_: Layer = layer or self.default_layer
-        # Don't `upper()` so camelNaming doesn't turn into UPPERNAMING, which is
-        # difficult to read
-        service_: str = service.strip() if service else self.default_service
-        category_: Category = category or self.default_category
-        severity_: Severity = severity or self.default_severity
-        self.code: str = self._generate_code(
-            layer=layer_,
-            service=service_,
-            category=category_,
-            severity=severity_,
+        # Recoverability (value upon call has overwriting priority); set before
+        # the code, which carries it
+        default_recoverable: bool = bool(self.recoverable)
+        self.recoverable = (
+            recoverable if isinstance(recoverable, bool) else default_recoverable
         )
-        self.msg_code: str = f"{self.msg}\n>> {self.code}"
 
-        # Recoverability (value upon call has overwriting priority)
-        if isinstance(recoverable, bool):
-            self.recoverable = recoverable
-        elif self.recoverable is None:
-            self.recoverable = False
+        if (
+            layer
+            or service
+            or category
+            or severity
+            or self.recoverable is not default_recoverable
+        ):
+            # Don't `upper()` so camelNaming doesn't turn into UPPERNAMING, which is
+            # difficult to read
+            self.code: str = self._generate_code(
+                layer=layer or self.default_layer,
+                service=service.strip() if service else self.default_service,
+                category=category or self.default_category,
+                severity=severity or self.default_severity,
+                recoverable=self.recoverable,
+            )
+        else:
+            self.code = self._default_code
+        self.msg_code: str = f"{self.msg}\n>> {self.code}"
 
-        # Context
-        self.__cause__: BaseException | None = cause
+        # Context; assigning `__cause__` also suppresses the implicit `__context__`,
+        # so only do it for an actual cause (`raise ... from` sets it anyway)
+        if cause is not None:
+            self.__cause__ = cause
         self._ctx: dict[str, object] | None = context
-        self._tstamp: datetime = datetime.now(tz=timezone.utc)
+        # Raw clock reading; only turned into a `datetime` if someone asks for it
+        self._tstamp: int = time.time_ns()
 
-        super().__init__(self.msg_code)
+        # `__str__` already gives `msg_code`; keep `args` to the plain message
+        super().__init__(self.msg)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Time of creation, in UTC."""
+
+        secs, nanos = divmod(self._tstamp, 1_000_000_000)
+        return datetime.fromtimestamp(secs, tz=timezone.utc).replace(
+            microsecond=nanos // 1_000
+        )
+
+    @property
+    def timestamp_iso(self) -> str:
+        """`timestamp` in ISO 8601 with microseconds, without building a `datetime`."""
+
+        secs, nanos = divmod(self._tstamp, 1_000_000_000)
+        t: time.struct_time = time.gmtime(secs)
+        return (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            f".{nanos // 1_000:06d}+00:00"
+        )
 
     @override
     def __str__(self) -> str:
@@ -110,21 +160,20 @@ class _BaseException(BaseException):
 
     @override
     def __repr__(self) -> str:
-        json_context: str = json.dumps(obj=self._ctx, indent=2, default=str)
+        json_context: str = dumps_indented(self._ctx)
         return f"{self.msg_code}:\n{json_context}"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)  # Few distinct services; saturates quickly
     def _generate_code(
-        self,
         layer: str,
         service: str,
         category: str,
         severity: str,
+        recoverable: bool = False,
     ) -> str:
         code: str = f"{layer}::{service}::{category}::{severity}"
-        if self.recoverable:
-            return f"{code}::RECOVERABLE"
-        else:
-            return code
+        return f"{code}{_RECOVERABLE}" if recoverable else code
 
 
 # ======================================================================================
@@ -42,6 +42,7 @@ class LoggerFactory:
 
     __slots__ = (
         "_config",
+        "_config_by_name",
         "_queue_manager",
         "_loggers",
         "_log",
@@ -55,6 +56,10 @@ class LoggerFactory:
         log_path: str | Path,
     ) -> None:
         self._config: LoggingSystemConfig = config
+        # Reversed so the first config of a duplicated name wins, as a scan would
+        self._config_by_name: dict[str, LoggerConfig] = {
+            cfg.name: cfg for cfg in reversed(config.loggers)
+        }
         self._queue_manager: QueueManager = queue_manager
         self._loggers: dict[str, BoundLoggerBase] = {}
 
@@ -101,13 +106,16 @@ class LoggerFactory:
             * `AlLoggerCreationError`: Failure to create logger due to other errors.
         """
 
-        if name in self._loggers:
-            return self._loggers[name]
+        cached: BoundLoggerBase | None = self._loggers.get(name)
+        if cached is not None:
+            return cached
 
         # Find config for this logger
-        logger_config: LoggerConfig | None = next(
-            (cfg for cfg in self._config.loggers if cfg.name == name), None
-        )
+        logger_config: LoggerConfig | None = self._config_by_name.get(name)
+        if logger_config is None:  # `loggers` may have grown since it was indexed
+            logger_config = next(
+                (cfg for cfg in self._config.loggers if cfg.name == name), None
+            )
         if logger_config is None:
             raise AlConfigurationError(
                 f"Logger `{name}` not found in configuration",
@@ -153,6 +161,14 @@ class LoggerFactory:
         self._log.debug(f"Successfully created logger `{v_cfg.name}` from config")
         return logger
 
+    def close(self) -> None:
+        """
+        Write out and close the factory's own log, stopping its writer thread.
+        Loggers already created keep working; they log through the `QueueManager`.
+        """
+
+        self._log.close()
+
     def _create_logger(self, config: LoggerConfig) -> BoundLoggerBase:
         """Create logger with handlers."""
 
@@ -165,9 +181,9 @@ class LoggerFactory:
                 )
 
             # Create processor pipeline
-            processors: list[Processor] = []
-            for cfg in config.processors:
-                processors = [self._create_processor(config=cfg)]
+            processors: list[Processor] = [
+                self._create_processor(config=cfg) for cfg in config.processors
+            ]
 
         except (AlHandlerError, AlProcessorError) as exc:
             raise AlLoggerCreationError(
@@ -182,6 +198,7 @@ class LoggerFactory:
             ),
             processors=processors,
             context={},
+            min_level=config.level,
         )
         self._log.debug(f"Created logger `{config.name}`")
 
@@ -234,9 +251,9 @@ class LoggerFactory:
 
         # Build handler-specific processors
         try:
-            processors: list[Processor] = []
-            for cfg in config.processors:
-                processors = [self._create_processor(config=cfg)]
+            processors: list[Processor] = [
+                self._create_processor(config=cfg) for cfg in config.processors
+            ]
             renderer: Renderer = self._create_renderer(config=config.renderer)
         except (RuntimeError, AlProcessorError) as exc:
             raise AlHandlerError(
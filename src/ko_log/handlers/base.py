@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
 from typing import TypeAlias, override
 
 from ..exceptions import AlLoggerError, AlProcessorError
 from ..models.handlers import HandlerConfig
-from ..processors import DropLog
-from ..types import EventDict, Processor, Renderer
+from ..processors import DROP, DropLog
+from ..types import Drop, EventDict, Processor, Renderer
 
 FuncHandler: TypeAlias = Callable[[HandlerConfig, Renderer, list[Processor]], "Handler"]
 
@@ -22,10 +23,17 @@ class Sink:
 
     Used for special cases, such as testing, and for redirecting stream logs that
     cannot be preconfigured to be directed towards the final destination.
+
+    With `capacity`, only the latest `capacity` events are kept (oldest dropped in
+    O(1)), so long-running or stress tests use constant memory. `None` keeps every
+    event in a plain `list`. Either way `write` is a single append, so handlers call it
+    without taking their locks.
     """
 
-    def __init__(self) -> None:
-        self.events: list[str] = []
+    def __init__(self, capacity: int | None = None) -> None:
+        self.events: list[str] | deque[str] = (
+            [] if capacity is None else deque(maxlen=capacity)
+        )
 
     def write(self, msg: str, /) -> None:
         self.events.append(msg)
@@ -41,6 +49,8 @@ class Sink:
 
 
 class _HasSinkMixin:
+    __slots__ = ("_sink",)
+
     def __init__(self) -> None:
         self._sink: Sink | None = None
 
@@ -65,7 +75,11 @@ class Handler(ABC, _HasSinkMixin):
     No formatting, filtering, or processing logic exists here.
     """
 
-    __slots__: tuple[()] = ()
+    __slots__ = (
+        "_renderer",
+        "_processors",
+        "_format",
+    )
 
     def __init__(
         self,
@@ -78,7 +92,12 @@ class Handler(ABC, _HasSinkMixin):
         self._sink: Sink | None = None
 
         self._renderer: Renderer = renderer
-        self._processors: list[Processor] = processors or []
+        # Frozen; iterated once per record
+        self._processors: tuple[Processor, ...] = tuple(processors or ())
+        # Without processors there is nothing to run; render directly
+        self._format: Callable[[EventDict], str | None] = (
+            self._fmt_msg if self._processors else renderer
+        )
 
     @override
     def __repr__(self) -> str:
@@ -91,7 +110,10 @@ class Handler(ABC, _HasSinkMixin):
     def emit_sync(self, event_dict: EventDict, /) -> None:
         """Process `EventDict` with blocking write to destination."""
 
-        fmtted_msg: str | None = self._fmt_msg(event_dict)
+        try:
+            fmtted_msg: str | None = self._format(event_dict)
+        except DropLog:  # Raised by custom processors or renderers
+            return
         if fmtted_msg is None:
             return  # Filtered out
         self._write_sync(fmtted_msg)
@@ -110,7 +132,10 @@ class Handler(ABC, _HasSinkMixin):
     async def emit_async(self, event_dict: EventDict, /) -> None:
         """Process `EventDict` through pipeline and write to destination."""
 
-        fmtted_msg: str | None = self._fmt_msg(event_dict)
+        try:
+            fmtted_msg: str | None = self._format(event_dict)
+        except DropLog:  # Raised by custom processors or renderers
+            return
         if fmtted_msg is None:
             return  # Filtered out
         await self._write_async(fmtted_msg)
@@ -135,15 +160,21 @@ class Handler(ABC, _HasSinkMixin):
     # ---------------------------------------------------------------------------------
 
     def _fmt_msg(self, event_dict: EventDict, /) -> str | None:
-        processed: EventDict = event_dict
-        for processor in self._processors:
-            try:
-                processed = processor(processed.copy())
-            except DropLog:
-                return None
-            except AlProcessorError as exc:
-                raise AlLoggerError(
-                    "Failed to finish processing the message through top-level processors",
-                    service=self.__class__.__name__,
-                ) from exc
+        processors: tuple[Processor, ...] = self._processors
+        if not processors:
+            return self._renderer(event_dict)
+
+        # One copy shields the caller's dict; each processor then owns what the
+        # previous one returned
+        processed: EventDict | Drop = event_dict.copy()
+        try:
+            for processor in processors:
+                processed = processor(processed)
+                if processed is DROP:
+                    return None
+        except AlProcessorError as exc:
+            raise AlLoggerError(
+                "Failed to finish processing the message through top-level processors",
+                service=self.__class__.__name__,
+            ) from exc
         return self._renderer(processed)
@@ -2,27 +2,80 @@ import asyncio
 import os
 import threading
 import time
+import weakref
 from _io import FileIO
 from _thread import lock
 from asyncio import Lock
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import override
 
-import aiofiles
-from aiofiles.threadpool import binary
-
 from ..exceptions import AlHandlerError
 from ..types import FileTextMode, Processor, Renderer
-from ..utils import validate_file_path
+from ..utils import resolve_encoder, validate_file_path
 from .base import Handler
 
+_HAS_WRITEV: bool = hasattr(os, "writev")
+_IOV_MAX: int = 1024  # The smallest `writev` vector limit of the supported platforms
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Write all `lines` to `fd`, gathered into one syscall per `_IOV_MAX` lines."""
+
+    for start in range(0, len(lines), _IOV_MAX):
+        chunk: list[bytes] = lines[start : start + _IOV_MAX]
+        total: int = sum(map(len, chunk))
+        written: int = os.writev(fd, chunk) if _HAS_WRITEV else 0
+        if written < total:  # Short write, or no `writev` on this platform
+            with memoryview(b"".join(chunk)) as view:
+                while written < total:
+                    written += os.write(fd, view[written:])
+
+
+def _append_lines(path: str, lines: list[bytes], lock: lock, /) -> None:
+    """
+    Append whatever is left in `lines` to `path`, through a handle of its own; how a
+    sync buffer is written out once its handler is collected or at interpreter exit.
+    """
+
+    with lock:
+        if not lines:
+            return
+        try:
+            fd: int = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                _write_lines(fd, lines)
+            finally:
+                os.close(fd)
+        except OSError:  # Nowhere left to report it
+            pass
+        lines.clear()
+
+
+def _create_exclusive(path: Path) -> bool:
+    """Atomically create `path` as an empty file; `False` if it already exists."""
+
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    except FileExistsError:
+        return False
+    return True
+
+
 # =====================================================================================
 #   Basic File Handler
 # =====================================================================================
 
 
 class AsyncFileHandler(Handler):
+    """
+    Async lines that arrive while a batch is being written are gathered into the
+    next one, which a worker thread writes in a single call once the batch before
+    it is done. Every async write waits for its own batch, so its line is in the
+    file when it returns. Sync writes go straight to their own handle.
+    """
+
     def __init__(
         self,
         renderer: Renderer,
@@ -38,13 +91,20 @@ class AsyncFileHandler(Handler):
         self._filepath: Path = validate_file_path(
             path=filename, create_missing_dir=True
         )
-        self._file_async: binary.AsyncFileIO | None = None
+        self._file_async: FileIO | None = None
         self._file_sync: FileIO | None = None
         self._mode: FileTextMode = mode
         self._encoding: str = encoding
+        self._encode: Callable[[str], bytes] = resolve_encoder(encoding)
+        self._newline: bytes = self._encode("\n")
 
         self._override: bool = override_existing
 
+        # Async lines still to be written, each followed by a newline vector; taken
+        # by `_batch_task` when its turn comes, after which lines start a new batch
+        self._batch: list[bytes] | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+
         self._lock_async: Lock = asyncio.Lock()
         self._lock_sync: lock = threading.Lock()
 
@@ -53,8 +113,7 @@ class AsyncFileHandler(Handler):
         line: str = msg + "\n"
 
         if self.sink:
-            with self._lock_sync:
-                self.sink.write(line)
+            self.sink.write(line)  # A single append; safe without the lock
             return
 
         if self._file_sync is None:
@@ -68,31 +127,44 @@ class AsyncFileHandler(Handler):
         assert self._file_sync is not None
 
         with self._lock_sync:
-            _ = self._file_sync.write(line.encode(encoding=self._encoding))
+            _ = self._file_sync.write(self._encode(line))
             self._file_sync.flush()
 
     @override
     async def _write_async(self, msg: str, /) -> None:
-        line: str = msg + "\n"
-
         if self.sink:
-            async with self._lock_async:
-                self.sink.write(line)
+            # A sync call can't be interleaved on the event loop; no lock needed
+            self.sink.write(msg + "\n")
             return
 
         if self._file_async is None:
-            try:
-                await self._open()
-            except (IsADirectoryError, IOError) as exc:
-                raise AlHandlerError(
-                    f"Failed to (await) open the file at path `{self._filepath!s}`",
-                    service=self.__class__.__name__,
-                ) from exc
-        assert self._file_async is not None
-
-        async with self._lock_async:
-            _ = await self._file_async.write(line.encode(encoding=self._encoding))
-            await self._file_async.flush()
+            async with self._lock_async:  # Concurrent first writes must share one file
+                if self._file_async is None:
+                    try:
+                        await self._open()
+                    except (IsADirectoryError, IOError) as exc:
+                        raise AlHandlerError(
+                            "Failed to (await) open the file at path"
+                            + f" `{self._filepath!s}`",
+                            service=self.__class__.__name__,
+                        ) from exc
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        task: asyncio.Task[None] | None = self._batch_task
+        if (self._batch is None) or (task is None) or (task.get_loop() is not loop):
+            # Lines left by a loop that stopped before writing them go first
+            self._batch = self._batch or []
+            task = self._batch_task = loop.create_task(self._write_batch(task))
+        self._batch += (self._encode(msg), self._newline)
+
+        try:
+            # Shielded, so a cancelled caller doesn't cancel the others' batch
+            await asyncio.shield(task)
+        except OSError as exc:
+            raise AlHandlerError(
+                f"Failed to (await) write to the file at path `{self._filepath!s}`",
+                service=self.__class__.__name__,
+            ) from exc
 
     @override
     async def flush(self) -> None:
@@ -100,14 +172,13 @@ class AsyncFileHandler(Handler):
         Flush both async and sync files to their destinations.
 
         WARNING:
-            There is no `flush_sync` method unlike `close` and `close_sync`, as writing
-            into this handler automatically performs a flush. It is highly unnecessary
-            and only in rare cases you are in need to manually call this method.
+            There is no `flush_sync` method unlike `close` and `close_sync`, as sync
+            writes go straight to the file. Async writes are batched; awaiting this
+            waits until the batch in flight has been written.
         """
 
         if self._file_async:
-            async with self._lock_async:
-                await self._file_async.flush()
+            await self._wait_batches()
 
         if self._file_sync:
             with self._lock_sync:
@@ -119,7 +190,8 @@ class AsyncFileHandler(Handler):
 
         if self._file_async is not None:
             async with self._lock_async:
-                await self._file_async.close()
+                await self._wait_batches()
+                self._file_async.close()
                 self._file_async = None
 
         if self._file_sync is not None:
@@ -152,21 +224,65 @@ class AsyncFileHandler(Handler):
         if self._override is False:
             await asyncio.to_thread(self._avoid_override)
 
-        self._file_async = await aiofiles.open(
-            file=self._filepath,
-            mode=self._mode,
+        self._file_async = await asyncio.to_thread(
+            self._filepath.open,
+            self._mode,
             buffering=0,
         )
 
+    async def _write_batch(self, previous: asyncio.Task[None] | None) -> None:
+        """Write the current batch, once `previous`, the batch before it, is written."""
+
+        if (previous is not None) and (
+            previous.get_loop() is asyncio.get_running_loop()
+        ):
+            _ = await asyncio.wait([previous])  # Its error went to its own writers
+
+        lines: list[bytes] | None = self._batch
+        self._batch = None
+        assert (lines is not None) and (self._file_async is not None)
+        await asyncio.to_thread(_write_lines, self._file_async.fileno(), lines)
+
+    async def _wait_batches(self) -> None:
+        """
+        Wait until every async line so far is written; each batch waits for the one
+        before it. Batches of an earlier event loop are left behind.
+        """
+
+        task: asyncio.Task[None] | None = self._batch_task
+        if (task is not None) and (task.get_loop() is asyncio.get_running_loop()):
+            _ = await asyncio.wait([task])
+
     def _avoid_override(self) -> None:
-        retry: int = 1
+        """
+        Move `_filepath` to a free `<filename>.NNNN` when it already exists. The path
+        is claimed with an exclusive create, so another process can't take it between
+        the check and the open.
+        """
+
         org_filepath: Path = self._filepath
-        while True:
-            if self._filepath.exists():
-                self._filepath = Path(f"{org_filepath}.{retry:04d}")
-                retry += 1
-                continue
-            break
+        if _create_exclusive(org_filepath):
+            return
+
+        def candidate(retry: int) -> Path:
+            return Path(f"{org_filepath}.{retry:04d}")
+
+        # Gallop to a free suffix, then bisect down to the first one after the
+        # taken run: O(log n) stats instead of one per existing file
+        taken: int = 0
+        free: int = 1
+        while candidate(free).exists():
+            taken, free = free, free * 2
+        while free - taken > 1:
+            mid: int = (taken + free) // 2
+            if candidate(mid).exists():
+                taken = mid
+            else:
+                free = mid
+
+        while not _create_exclusive(candidate(free)):  # Lost a race; keep walking
+            free += 1
+        self._filepath = candidate(free)
 
 
 # =====================================================================================
@@ -175,6 +291,18 @@ class AsyncFileHandler(Handler):
 
 
 class AsyncRotatingFileHandler(Handler):
+    """
+    Async lines that arrive while a batch is being written are gathered into the
+    next one, written once the batch before it is done; every async write waits for
+    its own batch. Batches are the only place the async file is opened and rotated.
+    Sync lines are collected in a buffer and written out once it holds
+    `_FLUSH_BYTES`, or by a timer `_FLUSH_INTERVAL` seconds after its first line;
+    rotation, `flush()` and `close()` always drain it first.
+    """
+
+    _FLUSH_BYTES: int = 64 * 1024
+    _FLUSH_INTERVAL: float = 1.0
+
     def __init__(
         self,
         renderer: Renderer,
@@ -195,10 +323,24 @@ class AsyncRotatingFileHandler(Handler):
         self._filepath: Path = validate_file_path(
             path=filename, create_missing_dir=True
         )
-        self._file_async: binary.AsyncFileIO | None = None
+        self._file_async: FileIO | None = None
         self._file_sync: FileIO | None = None
         self._mode: FileTextMode = mode
         self._encoding: str = encoding
+        self._encode: Callable[[str], bytes] = resolve_encoder(encoding)
+
+        # Encoded async lines still to be written; taken by `_batch_task` when its
+        # turn comes, after which lines start a new batch
+        self._batch: list[bytes] | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+        self._size_unknown: bool = False
+
+        # Pending lines of the sync handle, guarded by `_lock_sync`; kept as separate
+        # chunks so a flush hands them to `writev` without joining them first
+        self._buf_sync: list[bytes] = []
+        self._buf_sync_size: int = 0
+        # Armed by the first line of an empty buffer, so no line waits longer
+        self._timer_sync: threading.Timer | None = None
 
         # Rotation parameters
         self._max_bytes: int = max_bytes or 0
@@ -209,26 +351,48 @@ class AsyncRotatingFileHandler(Handler):
 
         # State tracking
         self._current_size: int = 0
-        self._last_rotation_time: float = 0
+        # Monotonic, so clock adjustments neither force nor delay a rotation
+        self._last_rotation_time: float = time.monotonic()
+        # Highest backup index on disk, looked up on the first rotation
+        self._last_backup: int | None = None
         self._base_filename: str = str(self._filepath)
+        # Generates the rotated filename of an index; picked once, so the rotation
+        # loops don't check for a custom `namer` on every name
+        self._get_rotated_filename: Callable[[int], str]
+        if namer is not None:
+            self._get_rotated_filename = partial(namer, self._base_filename)
+        else:
+            # Default naming: <filename>, <filename>.0001, <filename>.0002, etc.;
+            # formatted up front for every index a rotation touches
+            rotated_names: tuple[str, ...] = (self._base_filename,) + tuple(
+                f"{self._base_filename}.{index:04d}"
+                for index in range(1, self._backup_count + 1)
+            )
+            self._get_rotated_filename = rotated_names.__getitem__
 
         self._lock_async: Lock = asyncio.Lock()
         self._lock_sync: lock = threading.Lock()
 
+        # Lines still buffered are always bound for the current base file; written
+        # out there if the handler is collected, or the interpreter exits, first
+        _ = weakref.finalize(
+            self, _append_lines, self._base_filename, self._buf_sync, self._lock_sync
+        )
+
     def _rotate_files_sync(self) -> None:
         """Rotate files synchronously."""
 
         if self._backup_count <= 0:
             return
 
-        # Close current file
+        # Close current file; under the lock, so a due timer finds it gone
         if self._file_sync:
-            self._file_sync.close()
-            self._file_sync = None
+            with self._lock_sync:
+                self._flush_buf_sync()
+                self._file_sync.close()
+                self._file_sync = None
 
-        self._remove_if_reached_max_backup()
-        self._rotate_existing_files()
-        self._rename_current_to_first()
+        self._do_rotate()
 
         # Reopen
         self._open_sync()
@@ -236,61 +400,52 @@ class AsyncRotatingFileHandler(Handler):
     def _should_rotate_sync(self, msg_length: int) -> bool:
         """Check if we should rotate based on size or time."""
 
-        should_rotate: bool = False
+        self._current_size += msg_length
 
-        # Check size-based rotation
-        if self._max_bytes > 0:
-            self._current_size += msg_length
-            if self._current_size >= self._max_bytes:
-                should_rotate = True
-                self._current_size = 0
+        # Steady state: every configured limit is still ahead
+        if ((self._max_bytes <= 0) or (self._current_size < self._max_bytes)) and (
+            (self._rotation_interval <= 0)
+            or (time.monotonic() - self._last_rotation_time < self._rotation_interval)
+        ):
+            return False
 
-        # Check time-based rotation
+        # Reset only the limits that were reached
+        if (self._max_bytes > 0) and (self._current_size >= self._max_bytes):
+            self._current_size = 0
         if self._rotation_interval > 0:
-            current_time = time.time()
+            current_time: float = time.monotonic()
             if current_time - self._last_rotation_time >= self._rotation_interval:
-                should_rotate = True
                 self._last_rotation_time = current_time
-
-        return should_rotate
+        return True
 
     async def _rotate_files(self) -> None:
-        """Rotate files asynchronously."""
+        """Rotate files asynchronously; only called by the writer task."""
 
         if self._backup_count <= 0:
             return
 
         # Close current file
         if self._file_async:
-            await self._file_async.close()
+            self._file_async.close()
             self._file_async = None
 
-        await asyncio.to_thread(self._remove_if_reached_max_backup)
-        await asyncio.to_thread(self._rotate_existing_files)
-        await asyncio.to_thread(self._rename_current_to_first)
+        await asyncio.to_thread(self._do_rotate)
 
         # Reopen
         await self._open()
 
-    async def _should_rotate(self, msg_length: int) -> bool:
-        """Asynchronous wrapper for rotation check."""
-
-        # This is essentially the same logic, but I might want to make it truly async
-        # if I add async file stats checking
-        return self._should_rotate_sync(msg_length)
-
     @override
     def _write_sync(self, msg: str, /) -> None:
         line: str = msg + "\n"
-        line_bytes: int = len(line.encode(encoding=self._encoding))
 
         if self.sink:
-            with self._lock_sync:
-                self.sink.write(line)
+            self.sink.write(line)  # A single append; safe without the lock
             return
 
+        data: bytes = self._encode(line)
+
         # Check if we need to rotate before writing
-        if self._should_rotate_sync(msg_length=line_bytes):
+        if self._should_rotate_sync(msg_length=len(data)):
             self._rotate_files_sync()
 
         if self._file_sync is None:
@@ -301,80 +456,82 @@ class AsyncRotatingFileHandler(Handler):
                     f"Failed to open the file at path `{self._filepath!s}`",
                     service=self.__class__.__name__,
                 ) from exc
-            self._set_initial_file_size()
+            assert self._file_sync is not None
+            self._set_initial_file_size(self._file_sync.fileno())
         assert self._file_sync is not None
 
         with self._lock_sync:
-            _ = self._file_sync.write(line.encode(encoding=self._encoding))
-            self._file_sync.flush()
+            self._buf_sync.append(data)
+            self._buf_sync_size += len(data)
+            if self._buf_sync_size >= self._FLUSH_BYTES:
+                self._flush_buf_sync()
+            elif self._timer_sync is None:
+                self._timer_sync = threading.Timer(
+                    self._FLUSH_INTERVAL, self._flush_due_sync
+                )
+                self._timer_sync.daemon = True
+                self._timer_sync.start()
 
     @override
     async def _write_async(self, msg: str, /) -> None:
         line: str = msg + "\n"
-        line_bytes: int = len(line.encode(encoding=self._encoding))
 
         if self.sink:
-            async with self._lock_async:
-                self.sink.write(line)
+            # A sync call can't be interleaved on the event loop; no lock needed
+            self.sink.write(line)
             return
 
-        # Check if we need to rotate before writing
-        if await self._should_rotate(msg_length=line_bytes):
-            await self._rotate_files()
-
-        if self._file_async is None:
-            try:
-                await self._open()
-            except (IsADirectoryError, IOError) as exc:
-                raise AlHandlerError(
-                    f"Failed to (await) open the file at path `{self._filepath!s}`",
-                    service=self.__class__.__name__,
-                ) from exc
-            await asyncio.to_thread(self._set_initial_file_size)
-        assert self._file_async is not None
-
-        async with self._lock_async:
-            _ = await self._file_async.write(line.encode(encoding=self._encoding))
-            await self._file_async.flush()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        task: asyncio.Task[None] | None = self._batch_task
+        if (self._batch is None) or (task is None) or (task.get_loop() is not loop):
+            # Lines left by a loop that stopped before writing them go first
+            self._batch = self._batch or []
+            task = self._batch_task = loop.create_task(self._write_batch(task))
+        self._batch.append(self._encode(line))
+
+        try:
+            # Shielded, so a cancelled caller doesn't cancel the others' batch
+            await asyncio.shield(task)
+        except OSError as exc:
+            raise AlHandlerError(
+                f"Failed to (await) write to the file at path `{self._filepath!s}`",
+                service=self.__class__.__name__,
+            ) from exc
 
     @override
     async def flush(self) -> None:
         """
-        Flush both async and sync files to their destinations.
+        Write out the pending and buffered lines of both async and sync files.
 
         WARNING:
-            There is no `flush_sync` method unlike `close` and `close_sync`, as writing
-            into this handler automatically performs a flush. It is highly unnecessary
-            and only in rare cases you are in need to manually call this method.
+            There is no `flush_sync` method unlike `close` and `close_sync`; a sync
+            buffer is drained by `close_sync`, or by its timer once it is due.
         """
 
-        if self._file_async:
-            async with self._lock_async:
-                await self._file_async.flush()
+        await self._wait_batches()
 
         if self._file_sync:
             with self._lock_sync:
-                self._file_sync.flush()
+                self._flush_buf_sync()
 
     @override
     async def close(self) -> None:
         """Flush and close both async and sync file handle."""
 
-        if self._file_async is not None:
-            async with self._lock_async:
-                await self._file_async.close()
+        async with self._lock_async:
+            await self._wait_batches()
+            if self._file_async is not None:
+                self._file_async.close()
                 self._file_async = None
 
-        if self._file_sync is not None:
-            with self._lock_sync:
-                self._file_sync.close()
-                self._file_sync = None
+        self.close_sync()
 
     def close_sync(self) -> None:
         """Flush and close sync-only file handle."""
 
         if self._file_sync is not None:
             with self._lock_sync:
+                self._flush_buf_sync()
                 self._file_sync.close()
                 self._file_sync = None
 
@@ -382,47 +539,133 @@ class AsyncRotatingFileHandler(Handler):
     #   Helper methods
     # ---------------------------------------------------------------------------------
 
-    def _set_initial_file_size(self) -> None:
+    def _flush_buf_sync(self) -> None:
+        """Write out the sync buffer; the caller holds `_lock_sync`."""
+
+        if self._timer_sync is not None:
+            self._timer_sync.cancel()
+            self._timer_sync = None
+        if self._buf_sync and (self._file_sync is not None):
+            _write_lines(self._file_sync.fileno(), self._buf_sync)
+            self._buf_sync.clear()
+            self._buf_sync_size = 0
+
+    def _flush_due_sync(self) -> None:
+        """Timer callback; writes out lines that waited `_FLUSH_INTERVAL` seconds."""
+
+        with self._lock_sync:
+            self._timer_sync = None
+            try:
+                self._flush_buf_sync()
+            except (OSError, ValueError):  # Kept buffered; retried by the next flush
+                pass
+
+    async def _write_batch(self, previous: asyncio.Task[None] | None) -> None:
+        """Write the current batch, once `previous`, the batch before it, is written."""
+
+        if (previous is not None) and (
+            previous.get_loop() is asyncio.get_running_loop()
+        ):
+            _ = await asyncio.wait([previous])  # Its error went to its own writers
+
+        batch: list[bytes] | None = self._batch
+        self._batch = None
+        assert batch is not None
+
+        if self._file_async is None:  # First batch, or after a close or failed reopen
+            try:
+                await self._open()
+            except (IsADirectoryError, IOError) as exc:
+                raise AlHandlerError(
+                    f"Failed to (await) open the file at path `{self._filepath!s}`",
+                    service=self.__class__.__name__,
+                ) from exc
+            self._size_unknown = True
+
+        # Written in one go, split only where a line triggers a rotation
+        start: int = 0
+        for i, data in enumerate(batch):
+            if self._should_rotate_sync(msg_length=len(data)):
+                await self._write_lines_async(batch[start:i])
+                start = i
+                await self._rotate_files()
+            if self._size_unknown:  # Sampled after the first check, as in `_write_sync`
+                self._size_unknown = False
+                assert self._file_async is not None
+                self._set_initial_file_size(self._file_async.fileno())
+        await self._write_lines_async(batch[start:])
+
+    async def _wait_batches(self) -> None:
+        """
+        Wait until every async line so far is written; each batch waits for the one
+        before it. Batches of an earlier event loop are left behind.
+        """
+
+        task: asyncio.Task[None] | None = self._batch_task
+        if (task is not None) and (task.get_loop() is asyncio.get_running_loop()):
+            _ = await asyncio.wait([task])
+
+    async def _write_lines_async(self, lines: list[bytes]) -> None:
+        if lines:
+            assert self._file_async is not None
+            await asyncio.to_thread(_write_lines, self._file_async.fileno(), lines)
+
+    def _set_initial_file_size(self, fd: int) -> None:
+        # `fstat` on the open handle; cheap enough to not need a worker thread
         if self._max_bytes > 0:
-            self._current_size = os.path.getsize(filename=self._filepath)
+            self._current_size = os.fstat(fd).st_size
+
+    def _do_rotate(self) -> None:
+        """Shift every file one backup down, as a single blocking unit of work."""
+
+        if self._last_backup is None:
+            self._last_backup = self._find_last_backup()
+
+        self._remove_if_reached_max_backup()
+        self._rotate_existing_files()
+        self._rename_current_to_first()
+
+    def _find_last_backup(self) -> int:
+        for i in range(self._backup_count, 0, -1):
+            if os.path.exists(path=self._get_rotated_filename(i)):
+                return i
+        return 0
 
     def _rename_current_to_first(self) -> None:
-        if os.path.exists(path=self._base_filename):
-            os.rename(src=self._base_filename, dst=self._get_rotated_filename(index=1))
+        try:
+            os.rename(src=self._base_filename, dst=self._get_rotated_filename(1))
+        except FileNotFoundError:
+            return
+        if not self._last_backup:  # Otherwise already moved past by the shift
+            self._last_backup = min(1, self._backup_count)
 
     def _rotate_existing_files(self) -> None:
-        for i in range(self._backup_count - 1, 0, -1):
-            src: str = self._get_rotated_filename(index=i)
-            dst: str = self._get_rotated_filename(index=i + 1)
-            if os.path.exists(path=src):
+        # Only up to the last known backup, rather than every index the count allows
+        last: int = min(self._last_backup or 0, self._backup_count - 1)
+        for i in range(last, 0, -1):
+            src: str = self._get_rotated_filename(i)
+            dst: str = self._get_rotated_filename(i + 1)
+            try:
                 os.rename(src, dst)
+            except FileNotFoundError:  # Gaps in the backups are left as they are
+                continue
+        # Whether or not the base file is there to take the first slot
+        if last > 0:
+            self._last_backup = last + 1
 
     def _remove_if_reached_max_backup(self) -> None:
-        if self._backup_count > 0:
-            oldest_file: str = self._get_rotated_filename(index=self._backup_count)
-            if os.path.exists(path=oldest_file):
+        if (self._backup_count > 0) and (self._last_backup == self._backup_count):
+            oldest_file: str = self._get_rotated_filename(self._backup_count)
+            try:
                 os.remove(path=oldest_file)
-
-    def _get_rotated_filename(self, index: int) -> str:
-        """Generate rotated filename based on naming convention."""
-
-        if self._namer:
-            return self._namer(self._base_filename, index)
-
-        # Default naming: <filename>, <filename>.0001, <filename>.0002, etc.
-        if index == 0:
-            return self._base_filename
-        return f"{self._base_filename}.{index:04d}"
+            except FileNotFoundError:
+                pass
 
     def _open_sync(self) -> None:
-        self._file_sync = self._filepath.open(
-            self._mode,
-            buffering=0,
-        )
+        # The unbuffered `FileIO` that `Path.open` would return, minus `io.open`
+        self._file_sync = FileIO(self._base_filename, self._mode)
 
     async def _open(self) -> None:
-        self._file_async = await aiofiles.open(
-            file=self._filepath,
-            mode=self._mode,
-            buffering=0,
+        self._file_async = await asyncio.to_thread(
+            FileIO, self._base_filename, self._mode
         )
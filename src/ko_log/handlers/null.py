@@ -1,7 +1,3 @@
-import asyncio
-import threading
-from _thread import lock
-from asyncio import Lock
 from typing import override
 
 from ..types import Renderer
@@ -22,22 +18,18 @@ class AsyncNullHandler(Handler):
     def __init__(self, renderer: Renderer) -> None:
         super().__init__(renderer=renderer, processors=[])
 
-        self._lock_async: Lock = asyncio.Lock()
-        self._lock_sync: lock = threading.Lock()
-
     @override
     def _write_sync(self, msg: str, /) -> None:
         if self.sink is not None:
-            with self._lock_sync:
-                self.sink.write(msg)
-                return
+            self.sink.write(msg)
+            return
 
     @override
     async def _write_async(self, msg: str, /) -> None:
         if self.sink is not None:
-            async with self._lock_async:
-                self.sink.write(msg)
-                return
+            # A sync call can't be interleaved on the event loop; no lock needed
+            self.sink.write(msg)
+            return
 
     @override
     async def flush(self) -> None:
@@ -2,7 +2,6 @@ import asyncio
 import sys
 import threading
 from _thread import lock
-from asyncio import Lock
 from typing import TextIO, override
 
 from ..types import Processor, Renderer
@@ -24,36 +23,36 @@ class AsyncStreamHandler(Handler):
         super().__init__(renderer, processors)
         self._use_stderr: bool = use_stderr
 
-        self._lock_async: Lock = asyncio.Lock()
         self._lock_sync: lock = threading.Lock()
 
     @override
     def _write_sync(self, msg: str, /) -> None:
         if self.sink is not None:
-            with self._lock_sync:
-                self.sink.write(msg)
-                return
+            self.sink.write(msg)  # A single append; safe without the lock
+            return
 
         stream: TextIO = sys.stderr if self._use_stderr else sys.stdout
-        with self._lock_sync:
-            self._write_flush(stream, msg)
+        self._write_flush(stream, msg)
 
     @override
     async def _write_async(self, msg: str, /) -> None:
         if self.sink is not None:
-            async with self._lock_async:
-                self.sink.write(msg)
-                return
+            # A sync call can't be interleaved on the event loop; no lock needed
+            self.sink.write(msg)
+            return
 
         stream: TextIO = sys.stderr if self._use_stderr else sys.stdout
-        async with self._lock_async:
-            await asyncio.to_thread(self._write_flush, stream, msg)
+        await asyncio.to_thread(self._write_flush, stream, msg)
 
     def _write_flush(self, stream: TextIO | Sink, msg: str) -> None:
-        """For sync and async writes."""
+        """
+        For sync and async writes; async ones wait for the lock in their worker thread,
+        leaving the event loop free.
+        """
 
-        _ = stream.write(msg)
-        stream.flush()
+        with self._lock_sync:
+            _ = stream.write(msg)
+            stream.flush()
 
     @override
     async def flush(self) -> None:
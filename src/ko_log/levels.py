@@ -32,26 +32,26 @@ NAME_TO_LEVEL: dict[str, int] = {L: _LogLevel[L].value for L in LogLevel.__membe
 LEVEL_TO_NAME: dict[int, str] = {L.value: L.name for L in _LogLevel}
 
 
+# Every accepted spelling of a level, names (and so `LogLevel` members) and numbers
+# alike, resolved once so lookups need no type checks
+_LEVEL_RESOLVE: dict[int | str, int] = {
+    **NAME_TO_LEVEL,
+    **{L: L for L in LEVEL_TO_NAME},
+}
+_LEVEL_NAMES: dict[int | str, str] = {
+    key: LEVEL_TO_NAME[lvl] for key, lvl in _LEVEL_RESOLVE.items()
+}
+
+
 def get_level_name(level: LogLevels) -> str:
     try:
-        if isinstance(level, str):
-            lvl: int = NAME_TO_LEVEL[level]
-        elif isinstance(level, LogLevel):
-            lvl = NAME_TO_LEVEL[level.value]
-        else:
-            lvl = level
-        return LEVEL_TO_NAME[lvl]
-    except KeyError as exc:
+        return _LEVEL_NAMES[level]
+    except (KeyError, TypeError) as exc:
         raise ValueError(f"Unkown level name: {level}") from exc
 
 
 def check_level(level: LogLevels) -> int:
-    if isinstance(level, int):
-        if level not in LEVEL_TO_NAME:
-            raise ValueError(f"Unknown level: {level}")
-        return level
-    else:
-        try:
-            return NAME_TO_LEVEL[str(level)]
-        except KeyError:
-            raise ValueError(f"Unknown level: {level}")
+    try:
+        return _LEVEL_RESOLVE[level]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown level: {level}")
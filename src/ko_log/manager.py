@@ -4,7 +4,6 @@ import asyncio
 import threading
 from _thread import lock
 from asyncio import AbstractEventLoop, Event, Lock, Queue, Task
-from collections import defaultdict
 from typing import final
 
 from pydantic import ValidationError
@@ -13,7 +12,7 @@ from .exceptions import AlConfigurationError, AlLoggerError, AlQueueManagerError
 from .handlers.base import Handler, Sink
 from .models.framework import BackpressurePolicy, QueueConfig
 from .record import LogRecord
-from .types import JsonConfig, JsonValue
+from .types import EventDict, JsonConfig, JsonValue
 
 
 @final
@@ -30,6 +29,7 @@ class QueueManager:
         "_config",
         "_queue",
         "_handler_groups",
+        "_resolved_handlers",
         "_worker_task",
         "_shutdown_event",
         "_loop",
@@ -39,7 +39,10 @@ class QueueManager:
     def __init__(self, config: QueueConfig) -> None:
         self._config: QueueConfig = config
         self._queue: Queue[LogRecord | None] | None = None
-        self._handler_groups: dict[str, list[Handler]] = defaultdict(list)
+        self._handler_groups: dict[str, list[Handler]] = {}
+        # Handlers each logger name dispatches to, after the parent lookup; cleared
+        # whenever `_handler_groups` changes
+        self._resolved_handlers: dict[str, list[Handler]] = {}
         self._worker_task: Task[None] | None = None
         self._shutdown_event: Event | None = None
         self._loop: AbstractEventLoop | None = None
@@ -67,12 +70,12 @@ class QueueManager:
     # ---------------------------------------------------------------------------------
 
     def add_sink(self, logger_name: str, sink: Sink) -> None:
-        handlers: list[Handler] = self._handler_groups[logger_name]
+        handlers: list[Handler] = self._handler_groups.get(logger_name, [])
         for hdlr in handlers:
             hdlr.sink = sink
 
     def remove_sink(self, logger_name: str) -> None:
-        handlers: list[Handler] = self._handler_groups[logger_name]
+        handlers: list[Handler] = self._handler_groups.get(logger_name, [])
         for hdlr in handlers:
             hdlr.sink = None
 
@@ -137,6 +140,7 @@ class QueueManager:
 
         self._loop = None
         self._handler_groups.clear()
+        self._resolved_handlers.clear()
         self._worker_task = None
 
     def is_running(self) -> bool:
@@ -151,7 +155,8 @@ class QueueManager:
     def register_handler(self, logger_name: str, handler: Handler) -> None:
         """Register handler for specific logger."""
 
-        self._handler_groups[logger_name].append(handler)
+        self._handler_groups.setdefault(logger_name, []).append(handler)
+        self._resolved_handlers.clear()
 
     def unregister_handler(self, logger_name: str, handler: Handler) -> None:
         """Unregister handler from logger's group."""
@@ -161,6 +166,7 @@ class QueueManager:
                 self._handler_groups[logger_name].remove(handler)
             except ValueError:
                 pass
+            self._resolved_handlers.clear()
 
     # ---------------------------------------------------------------------------------
     #   Sync pushing onto destination
@@ -182,16 +188,19 @@ class QueueManager:
         ):
             return
 
-        handlers: list[Handler] = self._handler_groups.get(record.logger_name, [])
-        if not handlers:
-            handlers = self._find_parent_handlers(logger_name=record.logger_name)
+        handlers: list[Handler] = self._resolve_handlers(record.logger_name)
         if not handlers:
             return
 
+        # Renderers consume (mutate) the dict they are given, so each handler gets
+        # its own; the record's dict is built fresh per log and unused after this,
+        # so the last handler takes it rather than a copy
+        event_dict: EventDict = record.event_dict
         with self._lock:
             try:
-                for hdlr in handlers:
-                    hdlr.emit_sync(record.event_dict)
+                for hdlr in handlers[:-1]:
+                    hdlr.emit_sync(event_dict.copy())
+                handlers[-1].emit_sync(event_dict)
             except AlLoggerError as exc:
                 raise AlQueueManagerError(
                     "Failed to synchronously emit log message"
@@ -259,20 +268,28 @@ class QueueManager:
               Error occured whilst trying to emit log to specified handlers.
         """
 
-        # Get handlers of the specific logger
-        handlers: list[Handler] = self._handler_groups.get(record.logger_name, [])
-
-        # Support hierarchical loggers
-        if not handlers:
-            handlers = self._find_parent_handlers(logger_name=record.logger_name)
+        # Get handlers of the specific logger, or of its closest parent
+        handlers: list[Handler] = self._resolve_handlers(record.logger_name)
         if not handlers:
             return
 
-        # Dispatch to matched handlers
-        assert isinstance(record.event_dict, dict)
+        # Dispatch to matched handlers; as in `push_sync`, only the last one takes the
+        # record's own dict
+        event_dict: EventDict = record.event_dict
+        assert isinstance(event_dict, dict)
+
+        # Common case of one handler: skip building a gathering future
+        if len(handlers) == 1:
+            try:
+                await handlers[0].emit_async(event_dict)
+            except Exception:  # Swallowed, as `gather(return_exceptions=True)` does
+                pass
+            return
+
         try:
             _ = await asyncio.gather(
-                *(handler.emit_async(record.event_dict.copy()) for handler in handlers),
+                *(handler.emit_async(event_dict.copy()) for handler in handlers[:-1]),
+                handlers[-1].emit_async(event_dict),
                 return_exceptions=True,
             )
         except AlLoggerError as exc:
@@ -283,6 +300,20 @@ class QueueManager:
                 service=self.__class__.__name__,
             ) from exc
 
+    def _resolve_handlers(self, logger_name: str) -> list[Handler]:
+        """
+        Handlers of `logger_name`, or of its closest parent when it has none. The
+        lookup runs once per logger name until the handler groups change.
+        """
+
+        handlers: list[Handler] | None = self._resolved_handlers.get(logger_name)
+        if handlers is None:
+            handlers = self._handler_groups.get(logger_name)
+            if not handlers:
+                handlers = self._find_parent_handlers(logger_name=logger_name)
+            self._resolved_handlers[logger_name] = handlers
+        return handlers
+
     def _find_parent_handlers(self, logger_name: str) -> list[Handler]:
         """
         Find handlers from parent loggers.
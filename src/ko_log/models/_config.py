@@ -0,0 +1,11 @@
+from pydantic import ConfigDict
+
+# Shared by every config model; `params` models differ only by allowing extra keys
+BASE_CONFIG: ConfigDict = ConfigDict(
+    extra="forbid",
+    use_enum_values=True,
+    str_strip_whitespace=True,
+    str_min_length=1,
+    str_max_length=1_000,
+)
+PARAMS_CONFIG: ConfigDict = BASE_CONFIG | ConfigDict(extra="allow")
@@ -6,6 +6,7 @@ from typing import ClassVar
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..levels import LogLevel
+from ._config import BASE_CONFIG
 from .handlers import HandlerConfig
 from .processors import ProcessorConfig
 
@@ -26,13 +27,7 @@ class LoggerConfig(BaseModel):
     propagate: bool = False
     context: dict[str, str] = Field(default_factory=dict)
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="forbid",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = BASE_CONFIG
 
 class BackpressurePolicy(enum.StrEnum):
     """Define behavior when queue is full."""
@@ -51,13 +46,7 @@ class QueueConfig(BaseModel):
     # * FUTURE: multiple workers
     worker_count: int = 1
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="forbid",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = BASE_CONFIG
 
 
 class LoggingSystemConfig(BaseModel):
@@ -66,10 +55,4 @@ class LoggingSystemConfig(BaseModel):
     loggers: list[LoggerConfig] = Field(default_factory=list)
     default_level: LogLevel = LogLevel.INFO
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="forbid",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = BASE_CONFIG
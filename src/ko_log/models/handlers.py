@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..types import FileTextMode
 from ..utils import validate_file_path
+from ._config import PARAMS_CONFIG
 from ._mixins import TypeDiscriminationValidatorMixin
 from .processors import ProcessorConfig, RendererConfig
 
@@ -18,13 +19,7 @@ from .processors import ProcessorConfig, RendererConfig
 class _HandlerParamsConfig(BaseModel):
     """Base handler params configuration."""
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="allow",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = PARAMS_CONFIG
 
 
 class HandlerType(enum.StrEnum):
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import enum
+import os
+import warnings
 from collections.abc import Mapping
-from typing import ClassVar, Literal, TypeAlias
+from typing import TYPE_CHECKING, ClassVar, Literal, TypeAlias
 
-from pydantic import BaseModel, ConfigDict, Field
-from rich import color as rich_color
-from rich import emoji as rich_emoji
-from rich import style as rich_style
-from rich import theme as rich_theme
+import pydantic
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+if TYPE_CHECKING:
+    # `rich` is only imported once a colored renderer is configured
+    from rich.style import Style as RichStyle
+    from rich.theme import Theme as RichTheme
 
 from ..levels import LogLevel, LogLevels
+from ._config import PARAMS_CONFIG
 from ._mixins import TypeDiscriminationValidatorMixin
 
 # =====================================================================================
@@ -37,13 +42,7 @@ class ProcessorType(enum.StrEnum):
 class _ProcessorParamsConfig(BaseModel):
     """Base processor params configuration."""
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="allow",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = PARAMS_CONFIG
 
 
 # =====================================================================================
@@ -143,13 +142,7 @@ class _RendererParamsConfig(BaseModel):
     datefmt: str
     level: LogLevel = LogLevel.NOTSET
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(
-        extra="allow",
-        use_enum_values=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-        str_max_length=1_000,
-    )
+    model_config: ClassVar[ConfigDict] = PARAMS_CONFIG
 
 
 class RendererType(enum.StrEnum):
@@ -189,20 +182,29 @@ class PlainStreamRendererConfig(_RendererParamsConfig):
 
 
 COLOR_SYSTEM: TypeAlias = Literal["auto", "standard", "256", "truecolor", "windows"]
-RichTheme: TypeAlias = rich_theme.Theme
-RichStyle: TypeAlias = rich_style.Style
-RichColor: TypeAlias = rich_color.Color
-RichEmojiVariant: TypeAlias = rich_emoji.EmojiVariant
+RichEmojiVariant: TypeAlias = Literal["emoji", "text"]  # `rich.emoji.EmojiVariant`
 RichFormatTimeCallable: TypeAlias = str
 
 
 class RichThemeConfig(BaseModel):
     styles: Mapping[str, str | RichStyleConfig] | None = None
 
+    @property
+    def rich_theme(self) -> RichTheme:
+        """`rich` theme built from `styles`."""
+
+        from rich.theme import Theme as RichTheme
+
+        styles: dict[str, str | RichStyle] = {
+            name: style if isinstance(style, str) else style.rich_style
+            for name, style in (self.styles or {}).items()
+        }
+        return RichTheme(styles=styles)
+
 
 class RichStyleConfig(BaseModel):
-    color: RichColor | str | None = None
-    bgcolor: RichColor | str | None = None
+    color: str | None = None
+    bgcolor: str | None = None
     bold: bool | None = None
     dim: bool | None = None
     italic: bool | None = None
@@ -219,6 +221,19 @@ class RichStyleConfig(BaseModel):
     link: str | None = None
     meta: Mapping[str, str] | None = None
 
+    @property
+    def rich_style(self) -> RichStyle:
+        """`rich` style built from the set attributes."""
+
+        from rich.style import Style as RichStyle
+
+        attrs: dict[str, object] = {
+            name: value
+            for name in type(self).model_fields
+            if (value := getattr(self, name)) is not None
+        }
+        return RichStyle(**attrs)  # pyright: ignore[reportArgumentType]
+
 
 class ColoredStreamRendererConfig(_RendererParamsConfig):
     """Colored renderer configuration."""
@@ -257,9 +272,23 @@ class JSONStreamRendererConfig(_RendererParamsConfig):
     ensure_ascii: bool = True  # Non-ASCII characters are escaped
     allow_nan: bool = True  # Allow special floating point values
     indentation: int | None = 2
-    separators: tuple[str, str] = ",", ":"
+    separators: tuple[str, str] = ",", ":"  # Deprecated and ignored
     sort_keys: bool = False
 
+    @field_validator("separators", mode="after")
+    @classmethod
+    def warn_separators(cls, value: tuple[str, str]) -> tuple[str, str]:
+        # Only runs when set; attributed to the first frame outside pydantic and here
+        warnings.warn(
+            "`separators` of the JSON renderer is deprecated and has no effect",
+            DeprecationWarning,
+            skip_file_prefixes=(
+                os.path.dirname(pydantic.__file__),
+                os.path.dirname(os.path.dirname(__file__)),
+            ),
+        )
+        return value
+
 
 RendererConfigUnion: TypeAlias = (
     PlainFileRendererConfig
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import json
 import re
-from collections.abc import Mapping
+import sys
+import traceback
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
-from typing import cast, final
-
-from rich import console as rich_console
-from rich.console import Console
+from functools import lru_cache
+from operator import methodcaller
+from typing import TYPE_CHECKING, Final, cast, final
 
 from .exceptions import AlConfigurationError
-from .levels import LogLevel, check_level
+from .levels import NAME_TO_LEVEL, LogLevel, check_level
 from .models.processors import (
     COLOR_SYSTEM,
     CallsiteParameter,
@@ -20,12 +20,16 @@ from .models.processors import (
     RendererType,
     RichEmojiVariant,
     RichFormatTimeCallable,
-    RichStyle,
     RichStyleConfig,
-    RichTheme,
     RichThemeConfig,
 )
-from .types import EventDict, ExcInfo, Processor, Renderer
+from .types import Drop, EventDict, ExcInfo, Processor, Renderer
+from .utils import json_dumper, markup
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style as RichStyle
+    from rich.theme import Theme as RichTheme
 
 # =====================================================================================
 #   Drop signal
@@ -36,6 +40,11 @@ class DropLog(Exception):
     pass
 
 
+# Returned by a processor in place of its `EventDict` to drop the log without the
+# cost of raising; checked with `is DROP`
+DROP: Final = Drop.DROP
+
+
 # =====================================================================================
 #   General Processors (formatters & filters)
 # =====================================================================================
@@ -53,17 +62,18 @@ def add_callsite_params(config: ProcessorConfig) -> Processor:
         )
     params: set[CallsiteParameter] = set(config.params.parameters)
 
+    # I dont know how to get the callsite values from this context TT
+    # IM SORRYYYYYYYYY THIS IS THE ONLY WAY I KNOW AND IM LAZY TO THINK OF ANOTHER
+    # WORKAROUND TT
+    # All callsite parameters are automatically added per log call, only by specifying
+    # which ones included--the rest are removed, and those are known up front
+    excluded: tuple[str, ...] = tuple(
+        p.value for p in CallsiteParameter if p not in params
+    )
+
     def processor(event_dict: EventDict) -> EventDict:
-        # I dont know how to get the callsite values from this context TT
-        # IM SORRYYYYYYYYY THIS IS THE ONLY WAY I KNOW AND IM LAZY TO THINK OF ANOTHER
-        # WORKAROUND TT
-        for cparam in [p.value for p in CallsiteParameter]:
-            # All callsite parameters are automatically added per log call, only by
-            # specifying which ones included--the rest are removed
-            if cparam in params:
-                continue
-            else:
-                del event_dict[cparam]
+        for cparam in excluded:
+            _ = event_dict.pop(cparam, None)
         return event_dict
 
     return processor
@@ -96,9 +106,6 @@ def dict_tracebacks(config: ProcessorConfig) -> Processor:
     Removes `exc_info` after processing to avoid serialization issues.
     """
 
-    import sys
-    import traceback
-
     if (config.type != ProcessorType.DICT_TRACEBACKS) or (
         config.params.type != ProcessorType.DICT_TRACEBACKS
     ):
@@ -106,6 +113,9 @@ def dict_tracebacks(config: ProcessorConfig) -> Processor:
             "`DICT_TRACEBACKS` processor set with invalid params",
             service=dict_tracebacks.__name__,
         )
+    # Closure cells instead of a module attribute lookup per exception
+    current_exc_info: Callable[[], ExcInfo] = sys.exc_info
+    extract_tb: Callable[..., traceback.StackSummary] = traceback.extract_tb
 
     def processor(event_dict: EventDict) -> EventDict:
         exc_info: ExcInfo | bool | None = event_dict.pop(  # pyright: ignore[reportAny]
@@ -116,7 +126,7 @@ def dict_tracebacks(config: ProcessorConfig) -> Processor:
             return event_dict
 
         if exc_info is True:
-            exc_info = sys.exc_info()
+            exc_info = current_exc_info()
         exc_type, exc_value, exc_tb = exc_info
         if exc_type is None:
             return event_dict
@@ -133,7 +143,7 @@ def dict_tracebacks(config: ProcessorConfig) -> Processor:
                     "function": frame.name,
                     "code": frame.line,
                 }
-                for frame in traceback.extract_tb(tb=exc_tb)
+                for frame in extract_tb(exc_tb)
             ],
         }
 
@@ -150,8 +160,7 @@ def filter_by_level(config: ProcessorConfig) -> Processor:
     Create level filter processor.
     Drops events below minimum level before formatting.
 
-    Raises:
-    * `DropLog`: if event has a level below minimum.
+    Returns `DROP` for events below the minimum level.
     """
 
     if (config.type != ProcessorType.FILTER_BY_LEVEL) or (
@@ -162,15 +171,22 @@ def filter_by_level(config: ProcessorConfig) -> Processor:
             service=filter_by_level.__name__,
         )
     min_level: int = check_level(level=config.params.min_level)
+    # Upper and lower case names, so common levels skip `.upper()` per event
+    level_map: dict[str, int] = {
+        **{name.lower(): lvl for name, lvl in NAME_TO_LEVEL.items()},
+        **NAME_TO_LEVEL,
+    }
 
-    def processor(event_dict: EventDict) -> EventDict:
+    def processor(event_dict: EventDict) -> EventDict | Drop:
         level: str = cast(str, event_dict.get("level"))
         if not level:
             return event_dict
 
-        level_int: int = check_level(level=level.upper())
+        level_int: int | None = level_map.get(level)
+        if level_int is None:  # Mixed case, or invalid which raises
+            level_int = check_level(level=level.upper())
         if level_int < min_level:
-            raise DropLog
+            return DROP
 
         return event_dict
 
@@ -237,12 +253,10 @@ def filter_markup(config: ProcessorConfig) -> Processor:
             "`filter_markup` processor set with invalid params",
             service=filter_markup.__name__,
         )
-    pattern: re.Pattern[str] = re.compile(r"\[/?[^\]]*\]")
 
     def processor(event_dict: EventDict) -> EventDict:
-        event_dict["event"] = pattern.sub(
-            "",
-            event_dict.get("event", ""),  # pyright: ignore[reportAny]
+        event_dict["event"] = markup.strip(
+            event_dict.get("event", "")  # pyright: ignore[reportAny]
         )
         return event_dict
 
@@ -349,13 +363,68 @@ class _RendererBase:
         self._fmt: str = fmt
         self._datefmt: str = datefmt
         self._lvl: LogLevel = level
+        # Resolved once; `NOTSET` (0) lets every event through
+        self._lvl_int: int = check_level(level=level)
+        # Formats without `asctime` never pay for the date formatting
+        self._has_asctime: bool = "%(asctime)" in fmt
+
+    def _below_level(self, event_dict: EventDict) -> bool:
+        if not self._lvl_int:
+            return False
+        event_level: str = event_dict["level"]  # pyright: ignore[reportAny]
+        return check_level(level=event_level) < self._lvl_int
 
 
-def _percent_style_formatter(event_dict: EventDict, fmt: str, datefmt: str) -> str:
-    date: datetime = event_dict.pop(  # pyright: ignore[reportAny]
-        "timestamp", datetime.now(tz=timezone.utc)
-    )
-    event_dict["asctime"] = date.strftime(format=datefmt)
+_DATEFMT_DIRECTIVE: re.Pattern[str] = re.compile(r"%(.)", re.DOTALL)
+_DATEFMT_FIELDS: dict[str, str] = {
+    "Y": "{0.year:04d}",
+    "m": "{0.month:02d}",
+    "d": "{0.day:02d}",
+    "H": "{0.hour:02d}",
+    "M": "{0.minute:02d}",
+    "S": "{0.second:02d}",
+    "f": "{0.microsecond:06d}",
+    "%": "%",
+}
+
+
+@lru_cache(maxsize=32)
+def _compile_datefmt(datefmt: str) -> Callable[[datetime], str]:
+    """
+    Translate `datefmt` into a `str.format` template once, so numeric dates don't
+    re-parse the format through `strftime` on every event. Formats using any other
+    directive (names, locale, offsets) keep going through `strftime`.
+    """
+
+    parts: list[str] = []
+    last: int = 0
+    for match in _DATEFMT_DIRECTIVE.finditer(datefmt):
+        field: str | None = _DATEFMT_FIELDS.get(match.group(1))
+        if field is None:
+            return methodcaller("strftime", datefmt)
+        literal: str = datefmt[last : match.start()]
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        parts.append(field)
+        last = match.end()
+    if last < len(datefmt) and "%" in datefmt[last:]:  # Dangling '%'
+        return methodcaller("strftime", datefmt)
+    parts.append(datefmt[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts).format
+
+
+def _format_asctime(event_dict: EventDict, datefmt: str) -> None:
+    # Only read the clock when the bridge didn't already stamp the event
+    date: datetime | None = event_dict.pop("timestamp", None)
+    if date is None:
+        date = datetime.now(tz=timezone.utc)
+    event_dict["asctime"] = _compile_datefmt(datefmt)(date)
+
+
+def _percent_style_formatter(
+    event_dict: EventDict, fmt: str, datefmt: str, has_asctime: bool = True
+) -> str:
+    if has_asctime:
+        _format_asctime(event_dict, datefmt)
     fmtted_event: str = fmt % event_dict
     return fmtted_event
 
@@ -369,24 +438,22 @@ class PlainRenderer(_RendererBase):
         "_fmt",
         "_datefmt",
         "_lvl",
+        "_lvl_int",
+        "_has_asctime",
     )
 
     def __init__(self, fmt: str, datefmt: str, level: LogLevel) -> None:
         super().__init__(fmt, datefmt, level)
 
-    def __call__(self, event_dict: EventDict) -> str:
-        # Useless to set level to logger's default; log will still push through
-        if self._lvl == LogLevel.NOTSET:
-            return _percent_style_formatter(
-                event_dict, fmt=self._fmt, datefmt=self._datefmt
-            )
-
-        event_level: str = event_dict["level"]  # pyright: ignore[reportAny]
-        if check_level(level=event_level) < check_level(level=self._lvl):
-            raise DropLog
+    def __call__(self, event_dict: EventDict) -> str | None:
+        if self._below_level(event_dict):
+            return None
 
         return _percent_style_formatter(
-            event_dict, fmt=self._fmt, datefmt=self._datefmt
+            event_dict,
+            fmt=self._fmt,
+            datefmt=self._datefmt,
+            has_asctime=self._has_asctime,
         )
 
 
@@ -396,11 +463,14 @@ class JSONRenderer(_RendererBase):
         "_fmt",
         "_datefmt",
         "_lvl",
+        "_lvl_int",
+        "_has_asctime",
         "_skip_keys",
         "_ensure_ascii",
         "_allow_nan",
         "_indentation",
         "_sort_keys",
+        "_dumps",
     )
 
     def __init__(
@@ -421,33 +491,30 @@ class JSONRenderer(_RendererBase):
         self._allow_nan: bool = allow_nan
         self._indentation: int | None = indentation
         self._sort_keys: bool = sort_keys
+        self._dumps: Callable[[object], str] = json_dumper(
+            skip_keys=skip_keys,
+            ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan,
+            indent=indentation,
+            sort_keys=sort_keys,
+        )
 
-    def __call__(self, event_dict: EventDict) -> str:
-        # Useless to set level to logger's default; log will still push through
-        if self._lvl != LogLevel.NOTSET:
-            event_level: str = event_dict["level"]  # pyright: ignore[reportAny]
-            if check_level(level=event_level) < check_level(level=self._lvl):
-                raise DropLog
+    def __call__(self, event_dict: EventDict) -> str | None:
+        if self._below_level(event_dict):
+            return None
 
-        assert isinstance(event_dict, dict)
         psfmt_event: str = _percent_style_formatter(
-            event_dict=event_dict, fmt=self._fmt, datefmt=self._datefmt
+            event_dict=event_dict,
+            fmt=self._fmt,
+            datefmt=self._datefmt,
+            has_asctime=self._has_asctime,
         )
 
         ctx: str = event_dict.pop("context", "")  # pyright: ignore[reportAny]
         if not ctx:
-            return f"{psfmt_event}"
-
-        json_event_dict: str = json.dumps(
-            obj=ctx,
-            skipkeys=self._skip_keys,
-            ensure_ascii=self._ensure_ascii,
-            allow_nan=self._allow_nan,
-            indent=self._indentation,
-            separators=(",", ": "),
-            sort_keys=self._sort_keys,
-            default=str,
-        )
+            return psfmt_event
+
+        json_event_dict: str = self._dumps(ctx)
         return f"{psfmt_event}:\n{json_event_dict}"
 
 
@@ -462,6 +529,8 @@ class ColoredRenderer(_RendererBase):
         "_fmt",
         "_datefmt",
         "_lvl",
+        "_lvl_int",
+        "_has_asctime",
         "_color_system",
         "_force_terminal",
         "_force_interactive",
@@ -483,6 +552,9 @@ class ColoredRenderer(_RendererBase):
         "_legacy_windows",
         "_safe_box",
         "_environ",
+        "_verbatim",
+        "_special_chars",
+        "_console",
     )
 
     def __init__(
@@ -514,21 +586,15 @@ class ColoredRenderer(_RendererBase):
     ) -> None:
         super().__init__(fmt, datefmt, level)
 
-        _styles = None
-        if theme and theme.styles:
-            _styles: Mapping[str, str | RichStyle] | None = {
-                key: val for key, val in theme.styles if RichStyle(*val)
-            }
-
         self._color_system: COLOR_SYSTEM | None = color_system
         self._force_terminal: bool | None = force_terminal
         self._force_interactive: bool | None = force_interactive
         self._soft_wrap: bool = soft_wrap
-        self._theme: RichTheme | None = RichTheme(styles=_styles)
+        self._theme: RichTheme | None = theme.rich_theme if theme else None
         self._quiet: bool = quiet
         self._width: int | None = width
         self._height: int | None = height
-        self._style: RichStyle | None = RichStyle(*style) if style else None
+        self._style: RichStyle | None = style.rich_style if style else None
         self._no_color: bool | None = no_color
         self._tab_size: int = tab_size
         self.markup: bool = markup
@@ -541,15 +607,50 @@ class ColoredRenderer(_RendererBase):
         self._legacy_windows: bool | None = legacy_windows
         self._safe_box: bool = safe_box
         self._environ: Mapping[str, str] | None = environ
+        # Printable strings without markup (`[`) or emoji (`:`) codes render through
+        # `rich` unchanged, unless highlighting, a console style, or `quiet` apply
+        self._verbatim: bool = not (highlight or quiet or self._style)
+        self._special_chars: tuple[str, ...] = ("[",) * markup + (":",) * emoji
+        # Built on first render and reused; `rich` keeps capture buffers per thread
+        self._console: Console | None = None
+
+    def __call__(self, event_dict: EventDict) -> str | None:
+        if self._below_level(event_dict):
+            return None
+
+        console: Console | None = self._console
+        if console is None:
+            console = self._create_console()
+
+        # Format to asctime; otherwise drop the timestamp so it isn't rendered below
+        if self._has_asctime:
+            _format_asctime(event_dict, self._datefmt)
+        else:
+            _ = event_dict.pop("timestamp", None)
+
+        # Convert markup syntax to ANSI syntax; replacing values of existing keys
+        # doesn't resize the dict, so it's safe to do while iterating
+        for key, value in event_dict.items():  # pyright: ignore[reportAny]
+            if (
+                self._verbatim
+                and type(value) is str
+                and value.isprintable()
+                and not any(char in value for char in self._special_chars)
+            ):
+                continue
+            with console.capture() as capture:
+                console.print(value, soft_wrap=True, end="")
+            event_dict[key] = capture.get()
+
+        fmtted_event: str = self._fmt % event_dict
+
+        return fmtted_event + "\n"
 
-    def __call__(self, event_dict: EventDict) -> str:
-        # Useless to set level to logger's default; log will still push through
-        if self._lvl != LogLevel.NOTSET:
-            event_level: str = event_dict["level"]  # pyright: ignore[reportAny]
-            if check_level(level=event_level) < check_level(level=self._lvl):
-                raise DropLog
+    def _create_console(self) -> Console:
+        # Deferred so `rich` only loads when colored output is configured
+        from rich import console as rich_console
 
-        console: Console = rich_console.Console(
+        self._console = rich_console.Console(
             color_system=self._color_system,
             force_terminal=self._force_terminal,
             force_interactive=self._force_interactive,
@@ -572,19 +673,4 @@ class ColoredRenderer(_RendererBase):
             safe_box=self._safe_box,
             _environ=self._environ,
         )
-
-        # Format to asctime
-        date: datetime = event_dict.pop(  # pyright: ignore[reportAny]
-            "timestamp", datetime.now(tz=timezone.utc)
-        )
-        event_dict["asctime"] = date.strftime(format=self._datefmt)
-
-        # Convert markup syntax to ANSI syntax
-        for key, value in list(event_dict.items()):  # pyright: ignore[reportAny]
-            with console.capture() as capture:
-                console.print(value, soft_wrap=True, end="")
-            event_dict[key] = capture.get()
-
-        fmtted_event: str = self._fmt % event_dict
-
-        return str(fmtted_event + "\n")
+        return self._console
@@ -31,9 +31,14 @@ class LogRecord:
     def create(cls, event_dict: EventDict) -> LogRecord:
         """Factory method for creating log records."""
 
+        # Only read the clock when the bridge didn't already stamp the record
+        timestamp: datetime | None = event_dict.get("timestamp")
+        if timestamp is None:
+            timestamp = datetime.now(tz=timezone.utc)
+
         return cls(
-            logger_name=event_dict.get("name", "notset"),
-            event=event_dict.get("event", ""),
-            timestamp=event_dict.get("timestamp", datetime.now(tz=timezone.utc)),
-            event_dict=event_dict,
+            event_dict.get("name", "notset"),
+            event_dict.get("event", ""),
+            timestamp,
+            event_dict,
         )
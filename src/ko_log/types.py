@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import enum
 from collections.abc import Callable, Mapping, Sequence
 from types import TracebackType
-from typing import Any, Literal, Protocol, TypeAlias, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias, runtime_checkable
 
-from .models.processors import ProcessorConfig, RendererConfig
+if TYPE_CHECKING:
+    # `models` imports from this module; keep the cycle out of runtime imports
+    from .models.processors import ProcessorConfig, RendererConfig
 
 # =====================================================================================
 #   Base Logger protocol
@@ -27,6 +30,17 @@ class WrappedLogger(Protocol):
         pass
 
 
+# =====================================================================================
+#   Drop signal
+# =====================================================================================
+
+
+class Drop(enum.Enum):
+    """Type of `ko_log.processors.DROP`; a single member, compared by identity."""
+
+    DROP = "DROP"
+
+
 # =====================================================================================
 #   Types
 # =====================================================================================
@@ -52,8 +66,10 @@ Context: TypeAlias = (
 ContextScalar: TypeAlias = Scalar
 LogContext: TypeAlias = dict[str, Context]
 
-Renderer: TypeAlias = Callable[[EventDict], str]
-FuncRenderer: TypeAlias = Callable[[RendererConfig], Renderer]
+# `None` drops the log
+Renderer: TypeAlias = Callable[[EventDict], str | None]
+FuncRenderer: TypeAlias = Callable[["RendererConfig"], Renderer]
 
-Processor: TypeAlias = Callable[[EventDict], EventDict]
-FuncProcessor: TypeAlias = Callable[[ProcessorConfig], Processor]
+# `DROP` drops the log
+Processor: TypeAlias = Callable[[EventDict], EventDict | Drop]
+FuncProcessor: TypeAlias = Callable[["ProcessorConfig"], Processor]
@@ -1,7 +1,13 @@
 from . import markup
-from .path import validate_file_path
+from .encoding import resolve_encoder
+from .path import split_code_filename, validate_file_path
+from .serialize import dumps_indented, json_dumper
 
 __all__ = [
+    "dumps_indented",
+    "json_dumper",
     "markup",
+    "resolve_encoder",
+    "split_code_filename",
     "validate_file_path",
 ]
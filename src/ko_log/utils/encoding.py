@@ -0,0 +1,21 @@
+import codecs
+from collections.abc import Callable
+
+
+def resolve_encoder(encoding: str, /) -> Callable[[str], bytes]:
+    """
+    Look up `encoding` once and return a `str -> bytes` encoder for it.
+
+    Any alias of UTF-8 maps to the no-argument `str.encode`, CPython's fast path;
+    other codecs call their encoder directly, skipping the registry lookup that
+    `str.encode(encoding)` does per call.
+
+    Raises:
+        * `LookupError`: `encoding` is not a known codec.
+    """
+
+    codec: codecs.CodecInfo = codecs.lookup(encoding)
+    if codec.name == "utf-8":
+        return str.encode
+    encode = codec.encode
+    return lambda text: encode(text)[0]
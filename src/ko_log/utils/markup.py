@@ -1,6 +1,8 @@
 import re
 from re import Pattern
 
+_MARKUP: Pattern[str] = re.compile(r"\[/?[^\]]*\]")
+
 # -----------------------------------------------------------------------------
 #   Remover
 # -----------------------------------------------------------------------------
@@ -9,8 +11,10 @@ from re import Pattern
 def strip(t: str) -> str:
     """Strip markups ('[bold]...[/bold]') from messages."""
 
-    pattern: Pattern[str] = re.compile(r"\[/?[^\]]*\]")
-    return pattern.sub("", t)
+    # Most messages carry no markup; a substring check skips the regex engine
+    if "[" not in t:
+        return t
+    return _MARKUP.sub("", t)
 
 
 # -----------------------------------------------------------------------------
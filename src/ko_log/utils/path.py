@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 
@@ -40,3 +41,14 @@ def validate_file_path(
             f"Path `{str(path)}` can not be created, enable `allow_creation`"
         )
     return path_
+
+
+@functools.lru_cache(maxsize=2048)
+def split_code_filename(filename: str, /) -> tuple[str, str]:
+    """
+    Return the absolute path and base name of a code object's `co_filename`.
+
+    Cached as both are stable for the process lifetime of a source file.
+    """
+
+    return os.path.abspath(filename), os.path.basename(filename)
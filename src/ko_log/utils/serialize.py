@@ -0,0 +1,94 @@
+import json
+import re
+from collections.abc import Callable
+from functools import partial
+from types import ModuleType
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib encoder is used instead
+    orjson = None
+
+# How `orjson` writes a float, finite (`1.5`, `1e-7`) or not (`null`)
+_MAYBE_FLOAT: re.Pattern[bytes] = re.compile(rb"\d[.eE]|null")
+
+
+def json_dumper(
+    *,
+    skip_keys: bool,
+    ensure_ascii: bool,
+    allow_nan: bool,
+    indent: int | None,
+    sort_keys: bool,
+) -> Callable[[object], str]:
+    """
+    Build `json.dumps(obj, ..., default=str)` for fixed options, encoded by
+    `orjson` when it is installed and gives the exact same output.
+
+    That is only for the 2-space indented layout and objects without floats:
+    `orjson` formats floats differently (`1e-7` for `1e-07`) and writes non-finite
+    ones as `null`, whatever `allow_nan` says. Objects it rejects (e.g. integers
+    beyond 64 bits, keys that aren't strings) and non-ASCII output under
+    `ensure_ascii` go through `json` too.
+    """
+
+    stdlib: Callable[[object], str] = partial(
+        json.dumps,
+        skipkeys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=(",", ": "),
+        sort_keys=sort_keys,
+        default=str,
+    )
+    if orjson is None or indent != 2:
+        return stdlib
+
+    # `datetime`s and dataclasses keep their `str()` form, as `default=str` gives
+    option: int = (
+        orjson.OPT_INDENT_2  # pyright: ignore[reportAny]
+        | orjson.OPT_PASSTHROUGH_DATETIME  # pyright: ignore[reportAny]
+        | orjson.OPT_PASSTHROUGH_DATACLASS  # pyright: ignore[reportAny]
+    )
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS  # pyright: ignore[reportAny]
+    encode: Callable[..., bytes] = orjson.dumps  # pyright: ignore[reportAny]
+
+    def dumps(obj: object, /) -> str:
+        try:
+            data: bytes = encode(obj, default=str, option=option)
+        except TypeError:
+            return stdlib(obj)
+        if ensure_ascii and not data.isascii():  # `orjson` can't escape
+            return stdlib(obj)
+        # Only output that could hold a float is worth walking `obj` for one
+        if _MAYBE_FLOAT.search(data) and _has_float(obj):
+            return stdlib(obj)
+        return data.decode()
+
+    return dumps
+
+
+def _has_float(obj: object, /) -> bool:
+    """Whether `obj` holds a float, as a key or value of its dicts and lists."""
+
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(
+            _has_float(k) or _has_float(v)
+            for k, v in obj.items()  # pyright: ignore[reportUnknownVariableType]
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(
+            _has_float(v) for v in obj  # pyright: ignore[reportUnknownVariableType]
+        )
+    return False
+
+
+dumps_indented: Callable[[object], str] = json_dumper(
+    skip_keys=False, ensure_ascii=True, allow_nan=True, indent=2, sort_keys=False
+)
+"""`json.dumps(obj, indent=2, default=str)`, by way of `json_dumper`."""
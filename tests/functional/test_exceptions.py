@@ -0,0 +1,35 @@
+import pickle
+
+from ko_log.exceptions import AlHandlerError
+
+
+class _RecoverableHandlerError(AlHandlerError):
+    recoverable: bool | None = True
+
+
+def test_error_survives_pickling() -> None:
+    """Test errors keep their code, messages and context across processes."""
+
+    error: AlHandlerError = AlHandlerError(
+        "Failed to write", "Disk is full", service="FileHandler", context={"n": 1}
+    )
+
+    restored: AlHandlerError = pickle.loads(pickle.dumps(error))
+
+    assert restored.code == "HANDLER::FileHandler::IO::ERROR"
+    assert restored.user_msg == "Disk is full"
+    assert restored._ctx == {"n": 1}  # pyright: ignore[reportPrivateUsage]
+    assert restored.timestamp == error.timestamp
+    assert str(restored) == str(error)
+
+
+def test_subclass_recoverable_attribute_is_honored() -> None:
+    """Test a subclass setting `recoverable` is recoverable unless told otherwise."""
+
+    error: AlHandlerError = _RecoverableHandlerError("Retry later")
+    assert error.recoverable is True
+    assert error.code == "HANDLER::unknown::IO::ERROR::RECOVERABLE"
+
+    error = _RecoverableHandlerError("Give up", recoverable=False)
+    assert error.recoverable is False
+    assert error.code == "HANDLER::unknown::IO::ERROR"
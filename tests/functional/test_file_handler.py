@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from ko_log import Sink
+from ko_log import DROP, DropLog, Sink
 from ko_log import file_handler as _file_handler
 from ko_log.exceptions import AlHandlerError
 from ko_log.handlers import AsyncFileHandler, Handler
@@ -98,6 +98,40 @@ def test_write_sync_with_sink(file_handler_with_sink: Handler) -> None:
     assert file_handler._file_sync is None
 
 
+def test_dropped_event_skips_rest_of_chain(
+    default_file_handler_config: HandlerConfig, mock_renderer: Renderer
+) -> None:
+    """Test a processor returning `DROP` stops the chain and nothing is written."""
+
+    after_drop: Mock = Mock()
+    processors: list[Processor] = [lambda _: DROP, after_drop]
+    handler: AsyncFileHandler = _file_handler(
+        default_file_handler_config, mock_renderer, processors
+    )
+    handler.sink = Sink()
+
+    handler.emit_sync({"event": "Dropped", "level": "INFO"})
+
+    after_drop.assert_not_called()
+    assert handler.sink.events == []
+
+
+@pytest.mark.parametrize("dropped", [None, DropLog()], ids=["returned", "raised"])
+def test_renderer_drop_skips_write(
+    default_file_handler_config: HandlerConfig, dropped: DropLog | None
+) -> None:
+    """Test a renderer dropping the event, by `None` or `DropLog`, writes nothing."""
+
+    renderer: Mock = Mock(return_value=None, side_effect=dropped)
+    handler: AsyncFileHandler = _file_handler(default_file_handler_config, renderer, [])
+    handler.sink = Sink()
+
+    handler.emit_sync({"event": "Dropped", "level": "DEBUG"})
+
+    renderer.assert_called_once()
+    assert handler.sink.events == []
+
+
 def test_write_opens_lazily(file_handler: AsyncFileHandler) -> None:
     """Test that file is opened on first write."""
 
@@ -172,6 +206,52 @@ async def test_write_async(file_handler: AsyncFileHandler) -> None:
     assert test_message + "\n" == content
 
 
+@pytest.mark.asyncio
+async def test_concurrent_async_writes_are_batched_in_order(
+    file_handler: AsyncFileHandler,
+) -> None:
+    """Test concurrent async writes all reach the file, in order, once flushed."""
+
+    test_messages: list[str] = [f"Message {i:04d}" for i in range(1_000)]
+
+    _ = await asyncio.gather(*(file_handler._write_async(m) for m in test_messages))
+    await file_handler.flush()
+
+    content: str = read_file_content(file_handler._filepath)
+    assert content == "".join(f"{m}\n" for m in test_messages)
+    await file_handler.close()
+
+
+def test_async_writes_reach_file_without_close(file_handler: AsyncFileHandler) -> None:
+    """Test every awaited async write is in the file, even if never flushed."""
+
+    test_messages: list[str] = [f"Message {i:04d}" for i in range(5_000)]
+
+    async def write_all() -> None:
+        _ = await asyncio.gather(*(file_handler._write_async(m) for m in test_messages))
+
+    asyncio.run(write_all())
+
+    content: str = read_file_content(file_handler._filepath)
+    assert content == "".join(f"{m}\n" for m in test_messages)
+    asyncio.run(file_handler.close())
+
+
+def test_async_writes_on_a_new_event_loop(file_handler: AsyncFileHandler) -> None:
+    """Test a handler keeps writing and flushing once its first loop has ended."""
+
+    asyncio.run(file_handler._write_async("First"))
+
+    async def write_and_flush() -> None:
+        await file_handler._write_async("Second")
+        await asyncio.wait_for(file_handler.flush(), timeout=2)
+        await file_handler.close()
+
+    asyncio.run(write_and_flush())
+
+    assert read_file_content(file_handler._filepath) == "First\nSecond\n"
+
+
 @pytest.mark.asyncio
 async def test_open_overrides_existing(
     file_handler_with_existing_file: AsyncFileHandler,
@@ -222,6 +302,42 @@ async def test_open_overrides_2_existing(
     assert test_message + "\n" == content
 
 
+@pytest.mark.asyncio
+async def test_write_reopens_after_close(file_handler: AsyncFileHandler) -> None:
+    """Test writes after closing open the file again instead of using a stale one."""
+
+    file_handler._write_sync("First")
+    file_handler.close_sync()
+    file_handler._write_sync("Second")
+    assert file_handler._file_sync is not None
+    file_handler.close_sync()
+
+    await file_handler._write_async("Third")
+    await file_handler.close()
+    await file_handler._write_async("Fourth")
+    assert file_handler._file_async is not None
+    await file_handler.close()
+
+    # `wb` truncates on every reopen
+    assert read_file_content(file_handler._filepath) == "Fourth\n"
+
+
+def test_open_skips_many_existing(
+    temp_log_dir: Path,
+    file_handler_with_existing_file: AsyncFileHandler,
+) -> None:
+    """Test opening walks past a long run of existing files to the next free one."""
+
+    file_handler: AsyncFileHandler = file_handler_with_existing_file
+    for i in range(1, 38):
+        (temp_log_dir / f"temporary.log.{i:04d}").touch()
+
+    file_handler._write_sync("Test log message")
+    file_handler.close_sync()
+
+    assert file_handler._filepath.name == "temporary.log.0038"
+
+
 @pytest.mark.asyncio
 async def test_flush_without_file(file_handler: AsyncFileHandler) -> None:
     """Test flush method when no file is open."""
@@ -2,7 +2,7 @@ import sys
 
 import pytest
 
-from ko_log import DropLog
+from ko_log import DROP
 from ko_log.exceptions import AlConfigurationError
 from ko_log.models import (
     AddCallsiteParamsConfig,
@@ -314,9 +314,8 @@ class TestFilterByLevel:
         processor: Processor = proc_filter_by_level
         event_dict: EventDict = {"level": "DEBUG"}
 
-        # Internally, the queue manager catches these `DropLog`s as signals to drop the log
-        with pytest.raises(DropLog):
-            _ = processor(event_dict.copy())
+        # Handlers stop the chain and drop the log on this sentinel
+        assert processor(event_dict.copy()) is DROP
 
     def test_higher_log_passes(self, proc_filter_by_level: Processor) -> None:
         """Test processor lets higher logs than `DEBUG` pass."""
@@ -325,10 +324,31 @@ class TestFilterByLevel:
         info_log_dict: EventDict = {"level": "INFO"}
         warn_log_dict: EventDict = {"level": "WARN"}
 
-        # Doesn't raise `DropLog`
+        # Doesn't return `DROP`
         _ = processor(info_log_dict.copy())
         _ = processor(warn_log_dict.copy())
 
+    def test_level_case_is_ignored(self, proc_filter_by_level: Processor) -> None:
+        """Test processor resolves lower and mixed case level names."""
+
+        processor: Processor = proc_filter_by_level
+
+        assert processor({"level": "debug"}) is DROP
+        _ = processor({"level": "info"})
+        _ = processor({"level": "Warning"})
+
+    def test_drop_is_not_an_event_dict(self) -> None:
+        """Test `DROP` can't be mistaken for, or mutated into, an event."""
+
+        assert DROP != {}
+        assert not isinstance(DROP, dict)
+
+    def test_unknown_level_raises(self, proc_filter_by_level: Processor) -> None:
+        """Test processor rejects levels that aren't defined."""
+
+        with pytest.raises(ValueError):
+            _ = proc_filter_by_level({"level": "verbose"})
+
     def test_incorrect_processor_config_raises(self) -> None:
         """Test processor raises if it receives invalid configuration data."""
 
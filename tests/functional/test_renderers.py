@@ -17,7 +17,6 @@ from ko_log.models import (
 )
 from ko_log.processors import (
     ColoredRenderer,
-    DropLog,
     JSONRenderer,
     PlainRenderer,
     colored_renderer,
@@ -147,12 +146,55 @@ class TestPlainRenderer:
         assert "INFO" in result
         assert "Test log message" in result
 
+    @pytest.mark.parametrize(
+        "datefmt",
+        [
+            "%Y-%m-%dT%H:%M:%S.%f",
+            "{%d/%m} 100%%",
+            "%a %b %d %Y",  # Falls back to `strftime`
+            "trailing %",
+        ],
+    )
+    def test_plain_renderer_datefmt_matches_strftime(self, datefmt: str) -> None:
+        """Test compiled `datefmt` renders the same as `datetime.strftime`."""
+
+        renderer: PlainRenderer = PlainRenderer(
+            fmt="%(asctime)s", datefmt=datefmt, level=LogLevel.NOTSET
+        )
+        date: datetime = datetime(2024, 3, 5, 7, 8, 9, 1234, tzinfo=timezone.utc)
+
+        result: str = renderer({"event": "x", "level": "INFO", "timestamp": date})
+        assert result == date.strftime(datefmt)
+
+    def test_plain_renderer_skips_asctime_when_unused(self) -> None:
+        """Test `PlainRenderer` doesn't format dates its `fmt` never shows."""
+
+        renderer: PlainRenderer = PlainRenderer(
+            fmt="%(event)s", datefmt="%Y", level=LogLevel.NOTSET
+        )
+
+        with patch("ko_log.processors._format_asctime") as mock_format:
+            result: str = renderer({"event": "x", "level": "INFO"})
+
+        assert result == "x"
+        mock_format.assert_not_called()
+
+    def test_plain_renderer_stamps_missing_timestamp(self) -> None:
+        """Test `PlainRenderer` falls back to the current time without a timestamp."""
+
+        renderer: PlainRenderer = PlainRenderer(
+            fmt="%(asctime)s", datefmt="%Y", level=LogLevel.NOTSET
+        )
+
+        result: str = renderer({"event": "x", "level": "INFO"})
+        assert result == str(datetime.now(tz=timezone.utc).year)
+
     def test_plain_renderer_with_notset_level(
         self, plain_renderer_notset: PlainRenderer, sample_event_dict: EventDict
     ) -> None:
         """Test `PlainRenderer` with `NOTSET` level always renders."""
 
-        # Should not raise `DropLog`` for any level
+        # Should not drop any level
         sample_event_dict["level"] = "DEBUG"
         result: str = plain_renderer_notset(event_dict=sample_event_dict.copy())
 
@@ -161,7 +203,7 @@ class TestPlainRenderer:
     def test_plain_renderer_filters_by_level(
         self, plain_renderer_instance: PlainRenderer, sample_time: datetime
     ) -> None:
-        """Test `PlainRenderer` raises `DropLog` for events below configured level."""
+        """Test `PlainRenderer` returns `None` for events below configured level."""
 
         event_dict: EventDict = {
             "event": "Debug message",
@@ -169,8 +211,7 @@ class TestPlainRenderer:
             "timestamp": sample_time,
         }
 
-        with pytest.raises(DropLog):
-            _ = plain_renderer_instance(event_dict)
+        assert plain_renderer_instance(event_dict) is None
 
     def test_plain_renderer_allows_equal_or_higher_level(
         self, plain_renderer_instance: PlainRenderer
@@ -379,7 +420,7 @@ class TestJSONRenderer:
     def test_json_renderer_filters_by_level(
         self, json_renderer_instance: JSONRenderer, sample_time: datetime
     ) -> None:
-        """Test `JSONRenderer` raises DropLog for events below configured level."""
+        """Test `JSONRenderer` returns `None` for events below configured level."""
 
         event_dict: EventDict = {
             "event": "Debug message",
@@ -388,8 +429,7 @@ class TestJSONRenderer:
             "context": {"test": "value"},
         }
 
-        with pytest.raises(DropLog):
-            _ = json_renderer_instance(event_dict)
+        assert json_renderer_instance(event_dict) is None
 
     def test_json_renderer_with_notset_level(self, sample_time: datetime) -> None:
         """Test `JSONRenderer` with NOTSET level doesn't filter."""
@@ -451,6 +491,111 @@ class TestJSONRenderer:
         result_unicode: str = json_renderer_no_indent(event_dict=event_dict_unicode)
         assert "café" in result_unicode  # Not "caf\u00e9"
 
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("sort_keys", [True, False])
+    @pytest.mark.parametrize("allow_nan", [True, False])
+    def test_json_renderer_matches_stdlib_json(
+        self,
+        sample_time: datetime,
+        ensure_ascii: bool,
+        sort_keys: bool,
+        allow_nan: bool,
+    ) -> None:
+        """Test indented context renders as `json.dumps`, whichever encoder is used."""
+
+        renderer: JSONRenderer = JSONRenderer(
+            fmt="%(event)s",
+            datefmt="%Y-%m-%d",
+            level=LogLevel.NOTSET,
+            skip_keys=False,
+            ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan,
+            indentation=2,
+            sort_keys=sort_keys,
+        )
+        context: dict[str, object] = {
+            "text": "café",
+            "nested": {"b": [1, 2.5, 1e-7, None], "a": {}},
+            "date": sample_time,
+            "big": 2**70,
+        }
+        if allow_nan:
+            context["inf"] = float("inf")
+
+        result: str = renderer(
+            {
+                "event": "Test",
+                "level": "INFO",
+                "timestamp": sample_time,
+                "context": context,
+            }
+        )
+        assert result == "Test:\n" + json.dumps(
+            context,
+            ensure_ascii=ensure_ascii,
+            indent=2,
+            separators=(",", ": "),
+            sort_keys=sort_keys,
+            default=str,
+        )
+
+    def test_json_renderer_rejects_nan_unless_allowed(
+        self, sample_time: datetime
+    ) -> None:
+        """Test `allow_nan=False` raises on non-finite floats, as `json.dumps` does."""
+
+        renderer: JSONRenderer = JSONRenderer(
+            fmt="%(event)s",
+            datefmt="%Y-%m-%d",
+            level=LogLevel.NOTSET,
+            skip_keys=False,
+            ensure_ascii=True,
+            allow_nan=False,
+            indentation=2,
+            sort_keys=False,
+        )
+
+        with pytest.raises(ValueError):
+            _ = renderer(
+                {
+                    "event": "Test",
+                    "level": "INFO",
+                    "timestamp": sample_time,
+                    "context": {"ratio": float("nan")},
+                }
+            )
+
+    def test_json_renderer_ignores_deprecated_separators(
+        self, sample_time: datetime
+    ) -> None:
+        """Test the stream config's deprecated `separators` warns and has no effect."""
+
+        with pytest.warns(DeprecationWarning, match="separators") as record:
+            config: RendererConfig = RendererConfig.model_validate(
+                {
+                    "type": "stream_json",
+                    "params": {
+                        "fmt": "%(event)s",
+                        "datefmt": "%Y",
+                        "indentation": None,
+                        "separators": [";", "="],
+                    },
+                }
+            )
+        assert record[0].filename == __file__
+
+        renderer: Renderer = json_renderer(config)
+        result: str | None = renderer(
+            {
+                "event": "Test",
+                "level": "INFO",
+                "timestamp": sample_time,
+                "context": {"a": 1, "b": 2},
+            }
+        )
+
+        assert result == 'Test:\n{"a": 1,"b": 2}'
+
     def test_json_renderer_with_non_serializable_context(
         self, json_renderer_instance: JSONRenderer, sample_time: datetime
     ) -> None:
@@ -511,6 +656,47 @@ class TestColoredRendererFactory:
         renderer: Renderer = colored_renderer(config)
         assert isinstance(renderer, ColoredRenderer)
 
+    def test_colored_renderer_builds_style_and_theme(self) -> None:
+        """Test configured style and theme are materialized into `rich` objects."""
+
+        config: RendererConfig = RendererConfig.model_validate(
+            {
+                "type": "stream_colored",
+                "params": {
+                    "fmt": "%(event)s",
+                    "datefmt": "%Y",
+                    "style": {"color": "red", "bold": True},
+                    "theme": {
+                        "styles": {"hint": "italic", "warn": {"color": "yellow"}}
+                    },
+                },
+            }
+        )
+
+        renderer: Renderer = colored_renderer(config)
+        assert isinstance(renderer, ColoredRenderer)
+        assert str(renderer._style) == "bold red"
+        assert renderer._theme is not None
+        assert str(renderer._theme.styles["hint"]) == "italic"
+        assert str(renderer._theme.styles["warn"]) == "yellow"
+
+    @pytest.mark.parametrize("highlight", [None, False, True])
+    def test_colored_renderer_skips_rich_unless_highlighting(
+        self, highlight: bool | None
+    ) -> None:
+        """Test plain strings skip `rich` by default, but not once highlighting."""
+
+        params: dict[str, object] = {"fmt": "%(event)s", "datefmt": "%Y"}
+        if highlight is not None:
+            params["highlight"] = highlight
+        config: RendererConfig = RendererConfig.model_validate(
+            {"type": "stream_colored", "params": params}
+        )
+
+        renderer: Renderer = colored_renderer(config)
+        assert isinstance(renderer, ColoredRenderer)
+        assert renderer._verbatim is not highlight
+
     def test_colored_renderer_raises_on_wrong_type(self):
         """Test factory raises with wrong renderer type."""
 
@@ -585,7 +771,7 @@ class TestColoredRenderer:
     def test_colored_renderer_filters_by_level(
         self, colored_renderer_instance: ColoredRenderer, sample_time: datetime
     ) -> None:
-        """Test `ColoredRenderer` raises `DropLog` for events below configured level."""
+        """Test `ColoredRenderer` returns `None` for events below configured level."""
 
         event_dict: EventDict = {
             "event": "Debug message",
@@ -593,8 +779,7 @@ class TestColoredRenderer:
             "timestamp": sample_time,
         }
 
-        with pytest.raises(DropLog):
-            _ = colored_renderer_instance(event_dict)
+        assert colored_renderer_instance(event_dict) is None
 
     def test_colored_renderer_with_notset_level(self, sample_time: datetime) -> None:
         """Test `ColoredRenderer` with `NOTSET` level doesn't filter."""
@@ -668,6 +853,93 @@ class TestColoredRenderer:
         assert mock_console.capture.called  # pyright: ignore[reportAny]
         assert mock_console.print.called  # pyright: ignore[reportAny]
 
+    def test_colored_renderer_reuses_console(
+        self, colored_renderer_instance: ColoredRenderer, sample_time: datetime
+    ) -> None:
+        """Test `ColoredRenderer` builds its `rich` console once, on first render."""
+
+        mock_console: MagicMock = MagicMock()
+        mock_console.capture.return_value.__enter__.return_value.get.return_value = (  # pyright: ignore[reportAny]
+            "ProcessedValue"
+        )
+
+        with patch("rich.console.Console", return_value=mock_console) as console_cls:
+            for _ in range(3):
+                _ = colored_renderer_instance(
+                    {"event": "Test", "level": "INFO", "timestamp": sample_time}
+                )
+
+        console_cls.assert_called_once()
+
+    def test_colored_renderer_skips_rich_for_plain_strings(
+        self, colored_renderer_instance: ColoredRenderer, sample_time: datetime
+    ) -> None:
+        """Test `ColoredRenderer` only sends values with markup through `rich`."""
+
+        mock_console: MagicMock = MagicMock()
+        mock_console.capture.return_value.__enter__.return_value.get.return_value = (  # pyright: ignore[reportAny]
+            "ProcessedValue"
+        )
+
+        event_dict: EventDict = {
+            "event": "[bold]Test[/bold]",
+            "level": "INFO",
+            "timestamp": sample_time,
+        }
+
+        with patch("rich.console.Console", return_value=mock_console):
+            _ = colored_renderer_instance(event_dict)
+
+        print_calls = mock_console.print.call_args_list  # pyright: ignore[reportAny]
+        printed = [call.args[0] for call in print_calls]  # pyright: ignore[reportAny]
+        assert "[bold]Test[/bold]" in printed
+        assert "INFO" not in printed
+        assert event_dict["level"] == "INFO"
+
+    def test_colored_renderer_without_asctime_drops_timestamp(
+        self, sample_time: datetime
+    ) -> None:
+        """Test `ColoredRenderer` doesn't render a timestamp its `fmt` never shows."""
+
+        renderer: ColoredRenderer = ColoredRenderer(
+            fmt="%(event)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            level=LogLevel.NOTSET,
+            color_system=None,
+            force_terminal=False,
+            force_interactive=None,
+            soft_wrap=False,
+            theme=None,
+            quiet=False,
+            width=None,
+            height=None,
+            style=None,
+            no_color=True,
+            tab_size=8,
+            markup=True,
+            emoji=True,
+            emoji_variant=None,
+            highlight=False,
+            log_time=False,
+            log_path=False,
+            log_time_format="[%X]",
+            legacy_windows=None,
+            safe_box=True,
+            environ=None,
+        )
+        event_dict: EventDict = {
+            "event": "Test",
+            "level": "INFO",
+            "timestamp": sample_time,
+        }
+
+        with patch("ko_log.processors._format_asctime") as mock_format:
+            result: str = renderer(event_dict)
+
+        assert result == "Test\n"
+        assert "timestamp" not in event_dict
+        mock_format.assert_not_called()
+
     def test_colored_renderer_formats_asctime(
         self, colored_renderer_instance: ColoredRenderer, sample_time: datetime
     ) -> None:
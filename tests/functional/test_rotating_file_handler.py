@@ -1,10 +1,19 @@
 # pyright: reportPrivateUsage=false
 
+import asyncio
+import gc
+import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from ko_log import AsyncRotatingFileHandler, Handler
+from ko_log import rotating_file_handler as _rotating_file_handler
+from ko_log.models import HandlerConfig
+from ko_log.types import Renderer
 
 from .._helpers import create_test_messages, read_file_content
 
@@ -78,6 +87,136 @@ class TestAsyncRotatingFileHandlerBasics:
 
         await handler.close()
 
+    @pytest.mark.asyncio
+    async def test_buffered_sync_writes_reach_disk_without_flush(
+        self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
+    ) -> None:
+        """Test buffered sync lines are written once due, with no later write."""
+
+        handler: AsyncRotatingFileHandler = rotating_file_handler_no_rotation
+
+        with patch.object(AsyncRotatingFileHandler, "_FLUSH_INTERVAL", 0.05):
+            handler._write_sync("first")
+            handler._write_sync("second")
+
+            for _ in range(100):
+                if read_file_content(handler._filepath) == "first\nsecond\n":
+                    break
+                await asyncio.sleep(0.01)
+
+        assert read_file_content(handler._filepath) == "first\nsecond\n"
+        assert handler._timer_sync is None
+
+        await handler.close()
+
+    def test_buffered_sync_writes_reach_disk_at_exit(self, temp_log_dir: Path) -> None:
+        """Test lines still buffered when the interpreter exits are written out."""
+
+        log_file: Path = temp_log_dir / "exit.log"
+        script: str = (
+            "from ko_log.handlers import AsyncRotatingFileHandler\n"
+            + "handler = AsyncRotatingFileHandler(\n"
+            + "    str, [], filename=%r, mode='ab', encoding='utf-8',\n"
+            + "    max_bytes=None, backup_count=None, rotation_interval=None,\n"
+            + ")\n"
+            + "for i in range(100):\n"
+            + "    handler._write_sync(f'Message {i}')\n"
+        ) % str(log_file)
+        src_dir: Path = Path(__file__).parents[2] / "src"
+        env: dict[str, str] = {**os.environ, "PYTHONPATH": str(src_dir)}
+
+        _ = subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+        assert read_file_content(log_file) == "".join(
+            f"Message {i}\n" for i in range(100)
+        )
+
+    def test_buffered_sync_writes_reach_disk_when_collected(
+        self,
+        mock_renderer: Renderer,
+        default_rotating_file_handler_config: HandlerConfig,
+    ) -> None:
+        """Test lines still buffered when the handler is collected are written out."""
+
+        handler: Handler = _rotating_file_handler(
+            default_rotating_file_handler_config, mock_renderer, []
+        )
+        assert isinstance(handler, AsyncRotatingFileHandler)
+        filepath: Path = handler._filepath
+        handler._write_sync("Buffered")
+        assert handler._timer_sync is not None
+        handler._timer_sync.cancel()  # Its thread holds the handler until it ends
+        handler._timer_sync.join()
+
+        del handler
+        _ = gc.collect()
+
+        assert read_file_content(filepath) == "Buffered\n"
+
+    @pytest.mark.asyncio
+    async def test_flush_many_buffered_sync_writes(
+        self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler_no_rotation
+
+        # More lines than one `writev` call takes
+        messages: list[str] = create_test_messages(count=2000, msg_length=10)
+
+        for msg in messages:
+            handler._write_sync(msg)
+        await handler.flush()
+
+        assert read_file_content(handler._filepath) == "\n".join(messages) + "\n"
+
+        await handler.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_writes_keep_order(
+        self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler_no_rotation
+
+        messages: list[str] = create_test_messages(count=500, msg_length=10)
+
+        _ = await asyncio.gather(*(handler._write_async(msg) for msg in messages))
+        await handler.flush()
+
+        assert read_file_content(handler._filepath) == "\n".join(messages) + "\n"
+
+        await handler.close()
+
+    def test_async_writes_reach_file_without_close(
+        self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler_no_rotation
+
+        messages: list[str] = create_test_messages(count=5_000, msg_length=10)
+
+        async def write_all() -> None:
+            _ = await asyncio.gather(*(handler._write_async(msg) for msg in messages))
+
+        # Never flushed; every awaited write is already in the file
+        asyncio.run(write_all())
+
+        assert read_file_content(handler._filepath) == "\n".join(messages) + "\n"
+        asyncio.run(handler.close())
+
+    def test_async_writes_on_a_new_event_loop(
+        self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler_no_rotation
+
+        asyncio.run(handler._write_async("First"))
+
+        async def write_and_flush() -> None:
+            await handler._write_async("Second")
+            await asyncio.wait_for(handler.flush(), timeout=2)
+            await handler.close()
+
+        asyncio.run(write_and_flush())
+
+        assert read_file_content(handler._filepath) == "First\nSecond\n"
+
     @pytest.mark.asyncio
     async def test_close_method(
         self, rotating_file_handler_no_rotation: AsyncRotatingFileHandler
@@ -207,3 +346,111 @@ class TestSizeBasedRotation:
         # Check oldest existing file was removed
         oldest: Path = log_dir / "temporary.log.0004"
         assert not oldest.exists()
+
+    @pytest.mark.asyncio
+    async def test_rotation_keeps_gaps_between_backups(
+        self,
+        rotating_file_handler: AsyncRotatingFileHandler,
+        temp_log_dir: Path,
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler
+        log_dir: Path = temp_log_dir
+
+        for name in ("temporary.log", "temporary.log.0001", "temporary.log.0003"):
+            _ = (log_dir / name).write_text(data=f"{name}\n")
+
+        # Longer than `max_bytes`, so this single write rotates
+        handler._write_sync("x" * 120)
+        await handler.close()
+
+        assert read_file_content(log_dir / "temporary.log.0001") == "temporary.log\n"
+        assert read_file_content(log_dir / "temporary.log.0002") == (
+            "temporary.log.0001\n"
+        )
+        assert not (log_dir / "temporary.log.0003").exists()
+        assert read_file_content(log_dir / "temporary.log.0004") == (
+            "temporary.log.0003\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rotation_without_base_file_keeps_shifted_backups(
+        self,
+        rotating_file_handler: AsyncRotatingFileHandler,
+        temp_log_dir: Path,
+    ) -> None:
+        handler: AsyncRotatingFileHandler = rotating_file_handler
+        log_dir: Path = temp_log_dir
+
+        (log_dir / "temporary.log").unlink(missing_ok=True)
+        for name in ("temporary.log.0001", "temporary.log.0002"):
+            _ = (log_dir / name).write_text(data=f"{name}\n")
+
+        # Backups still shift down a slot, with no base file to take the first one
+        handler._do_rotate()
+        _ = (log_dir / "temporary.log").write_text(data="temporary.log\n")
+        handler._do_rotate()
+        await handler.close()
+
+        assert read_file_content(log_dir / "temporary.log.0001") == "temporary.log\n"
+        assert not (log_dir / "temporary.log.0002").exists()
+        assert read_file_content(log_dir / "temporary.log.0003") == (
+            "temporary.log.0001\n"
+        )
+        assert read_file_content(log_dir / "temporary.log.0004") == (
+            "temporary.log.0002\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rotation_with_custom_namer(
+        self, mock_renderer: Renderer, simple_log_file: Path, temp_log_dir: Path
+    ) -> None:
+        handler: AsyncRotatingFileHandler = AsyncRotatingFileHandler(
+            mock_renderer,
+            [],
+            filename=simple_log_file,
+            mode="ab",
+            encoding="utf-8",
+            max_bytes=100,
+            backup_count=2,
+            rotation_interval=None,
+            namer=lambda base, index: f"{base}-{index}",
+        )
+
+        messages: list[str] = create_test_messages(count=10, msg_length=20)
+
+        for msg in messages:
+            handler._write_sync(msg)
+        await handler.close()
+
+        assert (temp_log_dir / "temporary.log-1").exists()
+        assert not (temp_log_dir / "temporary.log.0001").exists()
+
+
+class TestTimeBasedRotation:
+    """Test suite for `AsyncRotatingFileHandler` interval rotation."""
+
+    @pytest.mark.asyncio
+    async def test_rotation_waits_for_interval(
+        self,
+        mock_renderer: Renderer,
+        default_rotating_file_handler_config: HandlerConfig,
+        temp_log_dir: Path,
+    ) -> None:
+        config: HandlerConfig = default_rotating_file_handler_config
+        params = config.params
+        params.max_bytes = 0  # pyright: ignore[reportAttributeAccessIssue]
+        params.rotation_interval = 60  # pyright: ignore[reportAttributeAccessIssue]
+        handler: Handler = _rotating_file_handler(config, mock_renderer, [])
+        assert isinstance(handler, AsyncRotatingFileHandler)
+        log_dir: Path = temp_log_dir
+
+        handler._write_sync("Before interval")
+        assert not (log_dir / "temporary.log.0001").exists()
+
+        # As if the interval has passed since the handler was created
+        handler._last_rotation_time -= 60
+        handler._write_sync("After interval")
+        await handler.close()
+
+        assert read_file_content(log_dir / "temporary.log.0001") == "Before interval\n"
+        assert read_file_content(handler._filepath) == "After interval\n"
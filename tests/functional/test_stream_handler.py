@@ -32,11 +32,9 @@ def test_init_with_stderr(stream_handler_to_stderr: Handler) -> None:
 
 
 def test_locks_init(stream_handler: AsyncStreamHandler) -> None:
-    """Test that both async and sync locks are initialized."""
+    """Test that the lock shared by sync and async writes is initialized."""
 
-    assert hasattr(stream_handler, "_lock_async")
     assert hasattr(stream_handler, "_lock_sync")
-    assert isinstance(stream_handler._lock_async, asyncio.Lock)
     assert isinstance(stream_handler._lock_sync, threading.Lock)
 
 
@@ -170,6 +168,17 @@ def test_write_flush_with_sink(stream_handler: AsyncStreamHandler) -> None:
     assert sink.events[0] == test_message
 
 
+def test_write_flush_with_bounded_sink(stream_handler: AsyncStreamHandler) -> None:
+    """Test a `Sink` with `capacity` keeps only the latest events."""
+
+    sink: Sink = Sink(capacity=2)
+
+    for i in range(5):
+        stream_handler._write_flush(stream=sink, msg=f"Message {i}")
+
+    assert list(sink.events) == ["Message 3", "Message 4"]
+
+
 @pytest.mark.asyncio
 async def test_flush_method(stream_handler: AsyncStreamHandler) -> None:
     """Test that flush method does nothing (no-op)."""
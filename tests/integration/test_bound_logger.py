@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+import weakref
 from collections.abc import AsyncGenerator
 from typing import TypeAlias
 from unittest.mock import AsyncMock, Mock
@@ -9,8 +10,9 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 import pytest_asyncio
 
-from ko_log import BoundLoggerBase, QueueManager
+from ko_log import DROP, BoundLoggerBase, QueueManager
 from ko_log.models import BackpressurePolicy, QueueConfig
+from ko_log.types import EventDict, LogContext
 
 _LoggerWithManager: TypeAlias = tuple[BoundLoggerBase, Mock, QueueManager]
 
@@ -95,6 +97,108 @@ class TestBoundLoggerIntegration:
         assert calls[0][0][0]["event"] == "Async debug"
         assert calls[0][0][0]["level"] == "DEBUG"
 
+    @pytest.mark.asyncio
+    async def test_min_level_drops_lower_levels(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test records below `min_level` never reach the wrapped logger."""
+
+        _, wrapped_logger, _ = bound_logger_with_sink
+
+        logger: BoundLoggerBase = BoundLoggerBase(
+            logger=wrapped_logger, processors=[], context={}, min_level="WARNING"
+        )
+
+        logger.debug("Dropped")
+        logger.info("Dropped")
+        logger.warning("Kept")
+        await logger.adebug("Dropped")
+        await logger.aerror("Kept")
+        with logger.info_life("Dropped scope") as life_logger:
+            assert life_logger is logger
+
+        # The threshold survives binding
+        logger.bind(user_id=1).info("Dropped")
+
+        assert wrapped_logger.log.call_count == 1  # pyright: ignore[reportAny]
+        assert wrapped_logger.async_log.call_count == 1  # pyright: ignore[reportAny]
+        sync_call = wrapped_logger.log.call_args  # pyright: ignore[reportAny]
+        async_call = wrapped_logger.async_log.call_args  # pyright: ignore[reportAny]
+        assert sync_call[0][0]["level"] == "WARNING"  # pyright: ignore[reportAny]
+        assert async_call[0][0]["level"] == "ERROR"  # pyright: ignore[reportAny]
+
+    @pytest.mark.asyncio
+    async def test_dropping_processor_skips_emit(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test a logger-level processor returning `DROP` ends the record there."""
+
+        _, wrapped_logger, _ = bound_logger_with_sink
+        after_drop: Mock = Mock()
+
+        logger: BoundLoggerBase = BoundLoggerBase(
+            logger=wrapped_logger,
+            processors=[lambda _: DROP, after_drop],
+            context={},
+        )
+
+        logger.info("Dropped")
+        await logger.ainfo("Dropped")
+
+        after_drop.assert_not_called()
+        wrapped_logger.log.assert_not_called()  # pyright: ignore[reportAny]
+        wrapped_logger.async_log.assert_not_called()  # pyright: ignore[reportAny]
+
+    def test_logger_supports_weak_references(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test loggers can be held weakly, e.g. by caller-side caches."""
+
+        logger, _, _ = bound_logger_with_sink
+
+        ref: weakref.ref[BoundLoggerBase] = weakref.ref(logger)
+        assert ref() is logger
+
+    def test_scope_reports_caller_site(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test `*_scope` and `*_life` records point at the `with` statement."""
+
+        _, wrapped_logger, _ = bound_logger_with_sink
+
+        logger: BoundLoggerBase = BoundLoggerBase(
+            logger=wrapped_logger, processors=[], context={}
+        )
+
+        with logger.info_scope("Generic scope", step=1):
+            pass
+        with logger.warning_life("Lifecycle"):
+            pass
+
+        calls = wrapped_logger.log.call_args_list  # pyright: ignore[reportAny]
+        assert len(calls) == 3  # pyright: ignore[reportAny]
+        for call in calls:  # pyright: ignore[reportAny]
+            event_dict: dict[str, object] = call[0][0]  # pyright: ignore[reportAny]
+            assert event_dict["funcName"] == "test_scope_reports_caller_site"
+            assert event_dict["filename"] == "test_bound_logger.py"
+        assert calls[0][0][0]["context"] == {"step": 1}  # pyright: ignore[reportAny]
+        assert calls[1][0][0]["level"] == "WARNING"  # pyright: ignore[reportAny]
+
+    def test_error_level_by_name_attaches_exc_info(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test plain `"ERROR"` and `"CRITICAL"` levels capture the active error."""
+
+        logger, _, _ = bound_logger_with_sink
+
+        for level in ("ERROR", "CRITICAL"):
+            try:
+                raise ValueError("Boom")
+            except ValueError:
+                exc_info = logger._is_exception(level, {"exc_info": True})
+            assert exc_info is not None
+            assert exc_info[0] is ValueError
+
     def test_logger_binding_new_context(
         self, bound_logger_with_sink: _LoggerWithManager
     ) -> None:
@@ -162,6 +266,49 @@ class TestBoundLoggerIntegration:
         assert new_logger._context["app"] == "new_app"
         assert new_logger._context["env"] == "test"
 
+    def test_logger_new_leaves_previous_context_intact(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test `new()` doesn't clear the dict an earlier logger was bound with."""
+
+        logger, _, _ = bound_logger_with_sink
+
+        context: dict[str, object] = {"old_key": "old_value"}
+        bound_logger: BoundLoggerBase = BoundLoggerBase(
+            logger=logger._logger, processors=[], context=context
+        )
+
+        _ = bound_logger.new(app="new_app")
+
+        assert context == {"old_key": "old_value"}
+
+    def test_processor_mutating_context_leaves_logger_intact(
+        self, bound_logger_with_sink: _LoggerWithManager
+    ) -> None:
+        """Test each record gets its own context, apart from the bound one."""
+
+        _, wrapped_logger, _ = bound_logger_with_sink
+        counter: list[int] = [0]
+
+        def add_trace_id(event_dict: EventDict) -> EventDict:
+            context: LogContext = event_dict["context"]  # pyright: ignore[reportAny]
+            _ = context.setdefault("trace_id", counter[0])
+            counter[0] += 1
+            return event_dict
+
+        for bound in ({}, {"app": "myapp"}):
+            counter[0] = 0
+            logger: BoundLoggerBase = BoundLoggerBase(
+                logger=wrapped_logger, processors=[add_trace_id], context=bound
+            )
+            with logger.info_life("Work"):
+                pass
+
+            assert "trace_id" not in logger._context
+            log: Mock = wrapped_logger.log  # pyright: ignore[reportAny]
+            records: list[EventDict] = [c.args[0] for c in log.call_args_list[-2:]]
+            assert [r["context"]["trace_id"] for r in records] == [0, 1]
+
     def test_logger_context_merging_in_log_calls(
         self, bound_logger_with_sink: _LoggerWithManager
     ) -> None:
@@ -93,6 +93,7 @@ class TestFullSystemIntegration:
         yield logger, sink, queue_manager, factory
 
         # Cleanup
+        factory.close()
         await queue_manager.shutdown()
         if temp_path.exists():
             temp_path.unlink()
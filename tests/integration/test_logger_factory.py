@@ -1,13 +1,17 @@
 # pyright: reportPrivateUsage=false
 
+import gc
+import threading
 from collections.abc import AsyncGenerator, Mapping
 from pathlib import Path
 from typing import TypeAlias
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 
 from ko_log import BoundLoggerBase, LoggerFactory, LogLevel, QueueManager
+from ko_log._logger import _LineWriter
 from ko_log.exceptions import AlConfigurationError
 from ko_log.models import (
     BackpressurePolicy,
@@ -49,6 +53,7 @@ class TestLoggerFactoryIntegration:
 
         yield factory, queue_manager
 
+        factory.close()
         await queue_manager.shutdown()
 
     # ----------------------------------------------------------------------------------
@@ -167,3 +172,119 @@ class TestLoggerFactoryIntegration:
         # Verify logger was created correctly
         assert isinstance(logger, BoundLoggerBase)
         assert logger._logger.name == "json_logger"
+
+    @pytest.mark.asyncio
+    async def test_repeated_json_config_creates_independent_loggers(
+        self, factory_with_queue_manager: _FactoryWithManager
+    ) -> None:
+        """Test equal JSON configs still get their own contexts."""
+
+        factory, _ = factory_with_queue_manager
+
+        json_config: Mapping[str, object] = {
+            "name": "cached_logger",
+            "context": {"source": "json"},
+        }
+        first: BoundLoggerBase = factory.get_logger_from_json(config=json_config)
+        # Same content, different key order
+        second: BoundLoggerBase = factory.get_logger_from_json(
+            config={"context": {"source": "json"}, "name": "cached_logger"}
+        )
+
+        assert first._context == second._context == {"source": "json"}
+        assert first._context is not second._context
+
+        with pytest.raises(AlConfigurationError):
+            _ = factory.get_logger_from_json(config={"name": "bad", "unknown": 1})
+        with pytest.raises(AlConfigurationError):
+            _ = factory.get_logger_from_json(config={"name": "bad", "unknown": 1})
+
+    def test_json_config_keeps_key_order(
+        self, factory_with_queue_manager: _FactoryWithManager
+    ) -> None:
+        """Test mappings in a JSON config keep the order they were given in."""
+
+        factory, _ = factory_with_queue_manager
+
+        logger: BoundLoggerBase = factory.get_logger_from_json(
+            config={"name": "ordered_logger", "context": {"zeta": "1", "alpha": "2"}}
+        )
+
+        assert list(logger._context) == ["zeta", "alpha"]
+
+    @pytest.mark.asyncio
+    async def test_logger_keeps_every_configured_processor(
+        self, factory_with_queue_manager: _FactoryWithManager
+    ) -> None:
+        """Test each processor config yields a processor, not just the last one."""
+
+        factory, _ = factory_with_queue_manager
+
+        json_config: Mapping[str, object] = {
+            "name": "multi_processor_logger",
+            "processors": [
+                {
+                    "type": "add_context_defaults",
+                    "params": {"type": "add_context_defaults"},
+                },
+                {"type": "filter_markup", "params": {"type": "filter_markup"}},
+            ],
+        }
+        logger: BoundLoggerBase = factory.get_logger_from_json(config=json_config)
+
+        assert len(logger._processors) == 2
+
+    def test_close_writes_log_and_stops_writer(
+        self, factory_with_queue_manager: _FactoryWithManager, random_log_file: Path
+    ) -> None:
+        """Test `close()` writes the factory's log out and stops its writer thread."""
+
+        factory, _ = factory_with_queue_manager
+
+        factory.close()
+        factory.close()  # Idempotent
+
+        assert "Successfully initialized" in random_log_file.read_text()
+        assert not factory._log._writer._thread.is_alive()
+
+    def test_unreferenced_factory_stops_writer(
+        self, factory_with_queue_manager: _FactoryWithManager, random_log_file: Path
+    ) -> None:
+        """Test a factory dropped without `close()` doesn't leave its thread behind."""
+
+        _, queue_manager = factory_with_queue_manager
+
+        def writer_threads() -> int:
+            return sum(t.name == "InternalLog" for t in threading.enumerate())
+
+        before: int = writer_threads()
+        for _ in range(5):
+            _ = LoggerFactory(
+                config=LoggingSystemConfig(loggers=[]),
+                queue_manager=queue_manager,
+                log_path=random_log_file,
+            )
+        _ = gc.collect()
+
+        assert writer_threads() == before
+
+    def test_failed_write_keeps_writer_serving(
+        self, factory_with_queue_manager: _FactoryWithManager, random_log_file: Path
+    ) -> None:
+        """Test a batch failing to write doesn't wedge `flush()` or later lines."""
+
+        factory, _ = factory_with_queue_manager
+        factory._log.flush()
+
+        with patch.object(
+            _LineWriter, "_flush_batch", side_effect=OSError(28, "No space left")
+        ):
+            factory._log.info("Lost line")
+            factory._log.flush()
+
+        factory._log.info("Kept line")
+        factory._log.flush()
+
+        content: str = random_log_file.read_text()
+        assert "Lost line" not in content
+        assert "Kept line" in content
@@ -70,6 +70,24 @@ class TestQueueManagerIntegration:
         # Verify handler was called asynchronously
         mock_handler.emit_async.assert_called_once_with(record.event_dict.copy())  # pyright: ignore[reportAny]
 
+    @pytest.mark.asyncio
+    async def test_failing_single_handler_keeps_worker_running(
+        self, queue_manager: QueueManager, mock_handler: Mock
+    ) -> None:
+        """Test that an error of the only handler doesn't stop the worker."""
+
+        mock_handler.emit_async = AsyncMock(side_effect=RuntimeError("Write failed"))
+        queue_manager.register_handler(logger_name="test_logger", handler=mock_handler)
+
+        for message in ("First message", "Second message"):
+            record: Mock = Mock()
+            record.logger_name = "test_logger"
+            record.event_dict = {"event": message, "level": "INFO"}
+            await queue_manager.enqueue(record)
+        await queue_manager.flush()
+
+        assert mock_handler.emit_async.call_count == 2  # pyright: ignore[reportAny]
+
     def test_hierarchical_logger_name_resolution(
         self, queue_manager: QueueManager, mock_handler: Mock
     ) -> None:
@@ -97,6 +115,56 @@ class TestQueueManagerIntegration:
         assert calls[0][0][0]["event"] == "Child message"
         assert calls[1][0][0]["event"] == "Grandchild message"
 
+    def test_child_handler_registered_after_parent_lookup(
+        self, queue_manager: QueueManager, mock_handler: Mock
+    ) -> None:
+        """Test that a resolved parent lookup doesn't outlive a new child handler."""
+
+        queue_manager.register_handler(logger_name="parent", handler=mock_handler)
+
+        record: Mock = Mock()
+        record.logger_name = "parent.child"
+        record.event_dict = {"event": "Child message", "level": "INFO"}
+
+        queue_manager.push_sync(record)
+        assert mock_handler.emit_sync.call_count == 1  # pyright: ignore[reportAny]
+
+        # From now on the child's own handler takes over
+        child_handler: Mock = Mock(spec=Handler)
+        queue_manager.register_handler(
+            logger_name="parent.child", handler=child_handler
+        )
+
+        queue_manager.push_sync(record)
+        assert mock_handler.emit_sync.call_count == 1  # pyright: ignore[reportAny]
+        child_handler.emit_sync.assert_called_once_with(  # pyright: ignore[reportAny]
+            record.event_dict
+        )
+
+    def test_each_handler_gets_an_unconsumed_event_dict(
+        self, queue_manager: QueueManager
+    ) -> None:
+        """Test that a handler consuming its event dict doesn't affect the next one."""
+
+        received: list[dict[str, str]] = []
+
+        def consume(event_dict: dict[str, str]) -> None:
+            received.append(event_dict.copy())
+            event_dict.clear()
+
+        for _ in range(3):
+            handler: Mock = Mock(spec=Handler)
+            handler.emit_sync = Mock(side_effect=consume)
+            queue_manager.register_handler(logger_name="test_logger", handler=handler)
+
+        record: Mock = Mock()
+        record.logger_name = "test_logger"
+        record.event_dict = {"event": "Shared message", "level": "INFO"}
+
+        queue_manager.push_sync(record)
+
+        assert received == [{"event": "Shared message", "level": "INFO"}] * 3
+
     def test_logger_without_handler_does_nothing(
         self, queue_manager: QueueManager, mock_handler: Mock
     ) -> None:
@@ -239,3 +307,22 @@ class TestQueueManagerIntegration:
         # Verify handler's sink was cleared
         queue_manager.remove_sink(logger_name="test_logger")
         assert mock_handler.sink is None  # pyright: ignore[reportAny]
+
+    def test_sink_on_logger_without_handlers_keeps_parent(
+        self, queue_manager: QueueManager, mock_handler: Mock, sink: Sink
+    ) -> None:
+        """Test that a sink call on an unknown logger doesn't hide its parent."""
+
+        queue_manager.register_handler(logger_name="parent", handler=mock_handler)
+        queue_manager.add_sink(logger_name="parent.child", sink=sink)
+        queue_manager.remove_sink(logger_name="parent.child")
+
+        record: Mock = Mock()
+        record.logger_name = "parent.child.grandchild"
+        record.event_dict = {"event": "Grandchild message", "level": "INFO"}
+
+        queue_manager.push_sync(record)
+
+        mock_handler.emit_sync.assert_called_once_with(  # pyright: ignore[reportAny]
+            record.event_dict
+        )